@@ -0,0 +1 @@
+""" Benchmarks for widechar_width.py. Run `python3 -m bench --help` from the repository. """
@@ -0,0 +1,164 @@
+""" Benchmarks widechar_width.py: per-call wcwidth latency and wcswidth throughput on
+synthetic corpora, and the import time and memory of the module.
+Run from the repository as `python3 -m bench`. Results can be written as JSON with
+--output, and compared to earlier results with --baseline.
+"""
+
+import argparse
+import json
+import os.path
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import widechar_width  # pylint: disable=wrong-import-position
+from bench.corpora import CORPORA, make_corpus  # pylint: disable=wrong-import-position
+from bench.import_time import measure  # pylint: disable=wrong-import-position
+
+# Metrics where a larger value is better. For all others, smaller is better.
+HIGHER_IS_BETTER = {"wcswidth_chars_per_s"}
+
+
+def best_time(func, repeat):
+    """Call func repeat times and return the fastest time in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench_corpus(lines, repeat):
+    """Return the metrics for one corpus, a list of lines."""
+    wcwidth = widechar_width.wcwidth
+    wcswidth = widechar_width.wcswidth
+    chars = "".join(lines)
+
+    def call_wcwidth():
+        for c in chars:
+            wcwidth(c)
+
+    def call_wcswidth():
+        for line in lines:
+            wcswidth(line)
+
+    wcwidth_time = best_time(call_wcwidth, repeat)
+    wcswidth_time = best_time(call_wcswidth, repeat)
+    return {
+        "chars": len(chars),
+        "wcwidth_ns_per_call": wcwidth_time / len(chars) * 1e9,
+        "wcswidth_ns_per_char": wcswidth_time / len(chars) * 1e9,
+        "wcswidth_chars_per_s": len(chars) / wcswidth_time,
+    }
+
+
+def bench_import(runs):
+    """Return the metrics for importing the module, each in a new interpreter."""
+    measure(ROOT, False)
+    times = [measure(ROOT, False)[0] for _ in range(runs)]
+    _, current, peak = measure(ROOT, True)
+    return {
+        "import_ms": statistics.median(times) * 1e3,
+        "import_kib": current / 1024,
+        "import_peak_kib": peak / 1024,
+    }
+
+
+def run(args):
+    """Run the benchmarks selected by args and return the results as a dict."""
+    results = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "extension": widechar_width._ext is not None,  # pylint: disable=protected-access
+        "lines": args.lines,
+        "seed": args.seed,
+        "metrics": {},
+    }
+    for name in args.corpus:
+        corpus = make_corpus(name, args.lines, args.seed)
+        results["metrics"][name] = bench_corpus(corpus, args.repeat)
+    if args.import_runs:
+        results["metrics"]["import"] = bench_import(args.import_runs)
+    return results
+
+
+def print_results(results, baseline=None):
+    """Print results as a table, with the change from baseline if given.
+    Return the largest slowdown against baseline as a fraction."""
+    print("Python %s (%s), extension %s"
+          % (results["python"], results["implementation"], "on" if results["extension"] else "off"))
+    print("%-16s %-22s %14s %14s %8s" % ("corpus", "metric", "value", "baseline", "change"))
+    worst = 0.0
+    old_metrics = baseline["metrics"] if baseline else {}
+    for name, metrics in results["metrics"].items():
+        for metric, value in metrics.items():
+            if metric == "chars":
+                continue
+            old = old_metrics.get(name, {}).get(metric)
+            if not old:
+                print("%-16s %-22s %14.2f" % (name, metric, value))
+                continue
+            change = value / old - 1
+            slowdown = -change if metric in HIGHER_IS_BETTER else change
+            worst = max(worst, slowdown)
+            print("%-16s %-22s %14.2f %14.2f %+7.1f%%" % (name, metric, value, old, change * 100))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m bench", description=__doc__)
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        choices=sorted(CORPORA),
+        default=list(CORPORA),
+        help="corpora to run (default: all)",
+    )
+    parser.add_argument("--lines", type=int, default=2000, help="lines per corpus")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the corpora")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per measurement, the fastest is kept"
+    )
+    parser.add_argument(
+        "--import-runs", type=int, default=10, help="imports to time, 0 to skip (default: 10)"
+    )
+    parser.add_argument(
+        "--pure", action="store_true", help="do not use the C extension, even if it is built"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results from this JSON file")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        help="exit with status 1 if any metric is worse than the baseline by more than "
+        "this fraction, e.g. 0.1",
+    )
+    args = parser.parse_args()
+
+    if args.pure and widechar_width._ext is not None:  # pylint: disable=protected-access
+        widechar_width._ext = None  # pylint: disable=protected-access
+        widechar_width.wcwidth = widechar_width._py_wcwidth  # pylint: disable=protected-access
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    worst = print_results(results, baseline)
+    if baseline and args.max_slowdown is not None and worst > args.max_slowdown:
+        print("slower than the baseline by %.1f%%" % (worst * 100))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
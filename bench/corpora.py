@@ -0,0 +1,98 @@
+""" Deterministic synthetic text corpora for the benchmarks. """
+
+import random
+
+# Characters that each corpus is built from, besides ASCII words.
+LATIN = "àáâãäåæçèéêëìíîïñòóôõöøùúûüýÿłńśźżčďěňřšťůž"
+COMBINING = [chr(c) for c in range(0x300, 0x370)]
+CJK = (
+    [chr(c) for c in range(0x4E00, 0x4E00 + 2000)]
+    + [chr(c) for c in range(0x3041, 0x3097)]
+    + [chr(c) for c in range(0x30A1, 0x30FB)]
+    + [chr(c) for c in range(0xAC00, 0xAC00 + 500)]
+    + list("、。「」（）！？：")
+)
+EMOJI = (
+    [chr(c) for c in range(0x1F600, 0x1F650)]
+    + [chr(c) for c in range(0x1F680, 0x1F6C6)]
+    + ["⌚", "❤️", "\U0001F44D\U0001F3FD", "\U0001F1EF\U0001F1F5"]
+    + ["\U0001F468‍\U0001F469‍\U0001F467", "\U0001F3F3️‍\U0001F308"]
+)
+PRIVATE_USE = [chr(c) for c in range(0xE000, 0xE900)] + [chr(0xF0000 + c) for c in range(64)]
+WORDS = (
+    "the of and request handled user session error cache miss timeout "
+    "connection retry server client GET POST /api/v1/items status=200 "
+    "latency_ms=12 id=5f3a9c trace span worker queue"
+).split()
+LEVELS = ["DEBUG", "INFO", "WARN", "ERROR"]
+
+
+def _line(rng, pieces, length):
+    """Return a line of about length characters, joined from pieces by spaces."""
+    out, size = [], 0
+    while size < length:
+        piece = pieces(rng)
+        out.append(piece)
+        size += len(piece) + 1
+    return " ".join(out)
+
+
+def _ascii(rng):
+    return rng.choice(WORDS)
+
+
+def _latin(rng):
+    word = list(rng.choice(WORDS))
+    for idx in range(len(word)):
+        roll = rng.random()
+        if roll < 0.2:
+            word[idx] = rng.choice(LATIN)
+        elif roll < 0.35:
+            word[idx] += rng.choice(COMBINING)
+    return "".join(word)
+
+
+def _cjk(rng):
+    return "".join(rng.choices(CJK, k=rng.randrange(2, 12)))
+
+
+def _emoji(rng):
+    return "".join(rng.choices(EMOJI, k=rng.randrange(1, 4))) + rng.choice(["", rng.choice(WORDS)])
+
+
+def _private_use(rng):
+    return rng.choice(PRIVATE_USE) + " " + rng.choice(WORDS)
+
+
+def _log(rng):
+    return rng.choice([_ascii, _ascii, _ascii, _latin, _cjk, _emoji, _private_use])(rng)
+
+
+CORPORA = {
+    "ascii": _ascii,
+    "latin_combining": _latin,
+    "cjk": _cjk,
+    "emoji": _emoji,
+    "private_use": _private_use,
+    "mixed_logs": _log,
+}
+
+
+def make_corpus(name, lines=2000, seed=0):
+    """Return a list of lines of the named corpus. The same arguments give the same lines."""
+    rng = random.Random("%s:%d" % (name, seed))
+    pieces = CORPORA[name]
+    result = []
+    for idx in range(lines):
+        line = _line(rng, pieces, rng.randrange(20, 120))
+        if name == "mixed_logs":
+            line = "2024-05-%02d %02d:%02d:%02d %-5s %s" % (
+                idx % 28 + 1,
+                idx % 24,
+                idx % 60,
+                (idx * 7) % 60,
+                rng.choice(LEVELS),
+                line,
+            )
+        result.append(line)
+    return result
@@ -0,0 +1,92 @@
+// Times WcWidth.Type.of from widechar_width.java for `make bench`.
+// widechar_width.java must be copied to WcWidth.java to compile it alongside this file.
+// Usage: java Bench MIN_SECONDS [FILE...]
+// See bench.c for the file format and output.
+
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+
+public class Bench {
+
+    private Bench() {
+    }
+
+    // The value widechar_wcwidth in widechar_width.h returns for type.
+    private static int code(WcWidth.Type type) {
+        switch (type) {
+            case ONE:
+                return 1;
+            case TWO:
+                return 2;
+            case NON_PRINT:
+                return -1;
+            case COMBINING:
+                return -2;
+            case AMBIGUOUS:
+                return -3;
+            case PRIVATE_USE:
+                return -4;
+            case UNASSIGNED:
+                return -5;
+            case WIDENED_IN_9:
+                return -6;
+            default:
+                return -7;
+        }
+    }
+
+    private static long run(int[] codepoints) {
+        long sum = 0;
+        for (int c : codepoints) {
+            sum += code(WcWidth.Type.of(c));
+        }
+        return sum;
+    }
+
+    private static void timeWorkload(String name, int[] codepoints, double minSeconds) {
+        long checksum = run(codepoints);
+        long total = 0;
+        long passes = 0;
+        long start = System.nanoTime();
+        double elapsed;
+        do {
+            total += run(codepoints);
+            passes++;
+            elapsed = (System.nanoTime() - start) / 1e9;
+        } while (elapsed < minSeconds);
+        if (total != checksum * passes) {
+            throw new IllegalStateException("inconsistent results for " + name);
+        }
+        System.out.printf("java %s %.3f %d%n", name, elapsed * 1e9 / ((double) codepoints.length * passes), checksum);
+    }
+
+    public static void main(String[] args) throws IOException {
+        if (args.length < 1) {
+            System.err.println("usage: java Bench MIN_SECONDS [FILE...]");
+            System.exit(2);
+        }
+        double minSeconds = Double.parseDouble(args[0]);
+
+        int[] sweep = new int[0x110000 - 0x800];
+        int count = 0;
+        for (int c = 0; c <= 0x10FFFF; c++) {
+            if (c < 0xD800 || c > 0xDFFF) {
+                sweep[count++] = c;
+            }
+        }
+        timeWorkload("sweep", sweep, minSeconds);
+
+        for (int i = 1; i < args.length; i++) {
+            Path path = Paths.get(args[i]);
+            ByteBuffer bytes = ByteBuffer.wrap(Files.readAllBytes(path)).order(ByteOrder.LITTLE_ENDIAN);
+            int[] codepoints = new int[bytes.remaining() / 4];
+            bytes.asIntBuffer().get(codepoints);
+            String name = path.getFileName().toString();
+            timeWorkload(name.substring(0, name.lastIndexOf('.')), codepoints, minSeconds);
+        }
+    }
+}
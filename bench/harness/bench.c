@@ -0,0 +1,104 @@
+// Times widechar_wcwidth from widechar_width_c.h for `make bench`.
+// Usage: bench_c MIN_SECONDS [FILE...]
+// Each FILE holds little-endian 32 bit codepoints. The sweep of all Unicode scalar
+// values always runs first. Prints one line per workload:
+//   port workload ns/lookup checksum
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "../../widechar_width_c.h"
+
+static double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+// Return the sum of the widths of count codepoints.
+static long long run(const uint32_t *codepoints, size_t count) {
+    long long sum = 0;
+    for (size_t i = 0; i < count; i++) {
+        sum += widechar_wcwidth(codepoints[i]);
+    }
+    return sum;
+}
+
+static void time_workload(const char *name, const uint32_t *codepoints, size_t count, double min_seconds) {
+    long long checksum = run(codepoints, count);
+    long long total = 0;
+    size_t passes = 0;
+    double start = now(), elapsed;
+    do {
+        total += run(codepoints, count);
+        passes++;
+        elapsed = now() - start;
+    } while (elapsed < min_seconds);
+    if (total != checksum * (long long)passes) {
+        fprintf(stderr, "inconsistent results for %s\n", name);
+        exit(1);
+    }
+    printf("c %s %.3f %lld\n", name, elapsed * 1e9 / ((double)count * passes), checksum);
+}
+
+// Read a file of codepoints. Return NULL on failure.
+static uint32_t *read_codepoints(const char *path, size_t *count) {
+    FILE *f = fopen(path, "rb");
+    if (!f) {
+        return NULL;
+    }
+    fseek(f, 0, SEEK_END);
+    long size = ftell(f);
+    fseek(f, 0, SEEK_SET);
+    uint32_t *codepoints = malloc(size > 0 ? size : 1);
+    *count = fread(codepoints, 4, size / 4, f);
+    fclose(f);
+    for (size_t i = 0; i < *count; i++) {
+        const unsigned char *b = (const unsigned char *)&codepoints[i];
+        codepoints[i] = b[0] | (b[1] << 8) | (b[2] << 16) | ((uint32_t)b[3] << 24);
+    }
+    return codepoints;
+}
+
+// Return the workload name for a path: its file name without the extension.
+static void workload_name(const char *path, char *name, size_t size) {
+    const char *base = strrchr(path, '/');
+    base = base ? base + 1 : path;
+    snprintf(name, size, "%s", base);
+    char *dot = strrchr(name, '.');
+    if (dot) {
+        *dot = '\0';
+    }
+}
+
+int main(int argc, char **argv) {
+    if (argc < 2) {
+        fprintf(stderr, "usage: %s MIN_SECONDS [FILE...]\n", argv[0]);
+        return 2;
+    }
+    double min_seconds = atof(argv[1]);
+
+    uint32_t *sweep = malloc(0x110000 * sizeof(uint32_t));
+    size_t count = 0;
+    for (uint32_t c = 0; c <= 0x10FFFF; c++) {
+        if (c < 0xD800 || c > 0xDFFF) {
+            sweep[count++] = c;
+        }
+    }
+    time_workload("sweep", sweep, count, min_seconds);
+    free(sweep);
+
+    for (int i = 2; i < argc; i++) {
+        char name[256];
+        uint32_t *codepoints = read_codepoints(argv[i], &count);
+        if (!codepoints) {
+            perror(argv[i]);
+            return 1;
+        }
+        workload_name(argv[i], name, sizeof name);
+        time_workload(name, codepoints, count, min_seconds);
+        free(codepoints);
+    }
+    return 0;
+}
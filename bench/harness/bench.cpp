@@ -0,0 +1,75 @@
+// Times widechar_wcwidth from widechar_width.h for `make bench`.
+// Usage: bench_cpp MIN_SECONDS [FILE...]
+// See bench.c for the file format and output.
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <fstream>
+#include <string>
+#include <vector>
+
+#include "../../widechar_width.h"
+
+// Return the sum of the widths of the codepoints.
+static long long run(const std::vector<uint32_t> &codepoints) {
+    long long sum = 0;
+    for (uint32_t c : codepoints) {
+        sum += widechar_wcwidth(c);
+    }
+    return sum;
+}
+
+static void time_workload(const std::string &name, const std::vector<uint32_t> &codepoints,
+                          double min_seconds) {
+    using clock = std::chrono::steady_clock;
+    long long checksum = run(codepoints);
+    long long total = 0;
+    size_t passes = 0;
+    auto start = clock::now();
+    double elapsed;
+    do {
+        total += run(codepoints);
+        passes++;
+        elapsed = std::chrono::duration<double>(clock::now() - start).count();
+    } while (elapsed < min_seconds);
+    if (total != checksum * (long long)passes) {
+        std::fprintf(stderr, "inconsistent results for %s\n", name.c_str());
+        std::exit(1);
+    }
+    std::printf("cpp %s %.3f %lld\n", name.c_str(),
+                elapsed * 1e9 / ((double)codepoints.size() * passes), checksum);
+}
+
+int main(int argc, char **argv) {
+    if (argc < 2) {
+        std::fprintf(stderr, "usage: %s MIN_SECONDS [FILE...]\n", argv[0]);
+        return 2;
+    }
+    double min_seconds = std::atof(argv[1]);
+
+    std::vector<uint32_t> sweep;
+    for (uint32_t c = 0; c <= 0x10FFFF; c++) {
+        if (c < 0xD800 || c > 0xDFFF) {
+            sweep.push_back(c);
+        }
+    }
+    time_workload("sweep", sweep, min_seconds);
+
+    for (int i = 2; i < argc; i++) {
+        std::string path = argv[i];
+        std::ifstream in(path, std::ios::binary);
+        if (!in) {
+            std::perror(argv[i]);
+            return 1;
+        }
+        std::vector<uint32_t> codepoints;
+        unsigned char b[4];
+        while (in.read(reinterpret_cast<char *>(b), 4)) {
+            codepoints.push_back(b[0] | (b[1] << 8) | (b[2] << 16) | (uint32_t(b[3]) << 24));
+        }
+        std::string name = path.substr(path.find_last_of('/') + 1);
+        name = name.substr(0, name.find_last_of('.'));
+        time_workload(name, codepoints, min_seconds);
+    }
+    return 0;
+}
@@ -0,0 +1,56 @@
+// Times widechar_wcwidth from widechar_width.js for `make bench`.
+// Usage: node bench.js MIN_SECONDS [FILE...]
+// See bench.c for the file format and output.
+"use strict";
+
+const fs = require("fs");
+const path = require("path");
+
+// widechar_width.js is a plain script, so evaluate it and take its function.
+const source = fs.readFileSync(path.join(__dirname, "..", "..", "widechar_width.js"), "utf8");
+const widechar_wcwidth = new Function(source + "\nreturn widechar_wcwidth;")();
+
+function run(codepoints) {
+    let sum = 0;
+    for (let i = 0; i < codepoints.length; i++)
+        sum += widechar_wcwidth(codepoints[i]);
+    return sum;
+}
+
+function timeWorkload(name, codepoints, minSeconds) {
+    const checksum = run(codepoints);
+    let total = 0;
+    let passes = 0;
+    const start = process.hrtime.bigint();
+    let elapsed;
+    do {
+        total += run(codepoints);
+        passes++;
+        elapsed = Number(process.hrtime.bigint() - start) / 1e9;
+    } while (elapsed < minSeconds);
+    if (total !== checksum * passes)
+        throw new Error("inconsistent results for " + name);
+    console.log(`node ${name} ${(elapsed * 1e9 / (codepoints.length * passes)).toFixed(3)} ${checksum}`);
+}
+
+function main(argv) {
+    if (argv.length < 1) {
+        console.error("usage: node bench.js MIN_SECONDS [FILE...]");
+        process.exit(2);
+    }
+    const minSeconds = Number(argv[0]);
+    const sweep = [];
+    for (let c = 0; c <= 0x10FFFF; c++)
+        if (c < 0xD800 || c > 0xDFFF)
+            sweep.push(c);
+    timeWorkload("sweep", Uint32Array.from(sweep), minSeconds);
+    for (const file of argv.slice(1)) {
+        const bytes = fs.readFileSync(file);
+        const codepoints = new Uint32Array(bytes.length / 4);
+        for (let i = 0; i < codepoints.length; i++)
+            codepoints[i] = bytes.readUInt32LE(i * 4);
+        timeWorkload(path.basename(file, path.extname(file)), codepoints, minSeconds);
+    }
+}
+
+main(process.argv.slice(2));
@@ -0,0 +1,57 @@
+""" Times wcwidth from widechar_width.py for `make bench`.
+Usage: python3 bench.py [--pure] MIN_SECONDS [FILE...]
+See bench.c for the file format and output. With --pure, the C extension is not used.
+"""
+
+import os.path
+import sys
+import time
+from array import array
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+import widechar_width  # pylint: disable=wrong-import-position
+
+
+def time_workload(port, name, codepoints, min_seconds):
+    """Print the time per lookup of the workload, with its checksum."""
+    wcwidth = widechar_width.wcwidth
+    checksum = sum(w if isinstance(w, int) else w.value for w in map(wcwidth, codepoints))
+    passes = 0
+    start = time.perf_counter()
+    while True:
+        # Consume the results without summing them, which would cost more than the lookups.
+        deque(map(wcwidth, codepoints), maxlen=0)
+        passes += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+    print("%s %s %.3f %d" % (port, name, elapsed * 1e9 / (len(codepoints) * passes), checksum))
+
+
+def main(args):
+    port = "python-ext" if widechar_width._ext else "python"  # pylint: disable=protected-access
+    if args and args[0] == "--pure":
+        args = args[1:]
+        port = "python"
+        if widechar_width._ext:  # pylint: disable=protected-access
+            widechar_width._ext = None  # pylint: disable=protected-access
+            widechar_width.wcwidth = widechar_width._py_wcwidth  # pylint: disable=protected-access
+    if not args:
+        sys.exit(__doc__)
+    min_seconds = float(args[0])
+    sweep = array("I", (c for c in range(0x110000) if not 0xD800 <= c <= 0xDFFF))
+    time_workload(port, "sweep", sweep, min_seconds)
+    for path in args[1:]:
+        codepoints = array("I")
+        with open(path, "rb") as f:
+            codepoints.frombytes(f.read())
+        if sys.byteorder == "big":
+            codepoints.byteswap()
+        name = os.path.splitext(os.path.basename(path))[0]
+        time_workload(port, name, codepoints, min_seconds)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
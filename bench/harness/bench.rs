@@ -0,0 +1,100 @@
+//! Times WcWidth::from_char and WcLookupTable::classify from widechar_width.rs for
+//! `make bench`.
+//! Usage: bench_rs MIN_SECONDS [FILE...]
+//! See bench.c for the file format and output.
+
+#[path = "../../widechar_width.rs"]
+#[allow(dead_code)]
+mod widechar_width;
+
+use std::hint::black_box;
+use std::time::Instant;
+use widechar_width::{WcLookupTable, WcWidth};
+
+/// The value widechar_wcwidth in widechar_width.h returns for w.
+fn code(w: WcWidth) -> i64 {
+    match w {
+        WcWidth::One => 1,
+        WcWidth::Two => 2,
+        WcWidth::NonPrint => -1,
+        WcWidth::Combining => -2,
+        WcWidth::Ambiguous => -3,
+        WcWidth::PrivateUse => -4,
+        WcWidth::Unassigned => -5,
+        WcWidth::WidenedIn9 => -6,
+        WcWidth::NonCharacter => -7,
+    }
+}
+
+fn time_workload<F: Fn(char) -> WcWidth>(
+    port: &str,
+    name: &str,
+    chars: &[char],
+    min_seconds: f64,
+    f: F,
+) {
+    let run = || chars.iter().map(|&c| code(f(black_box(c)))).sum::<i64>();
+    let checksum = run();
+    let mut total = 0;
+    let mut passes = 0;
+    let start = Instant::now();
+    let mut elapsed;
+    loop {
+        total += black_box(run());
+        passes += 1;
+        elapsed = start.elapsed().as_secs_f64();
+        if elapsed >= min_seconds {
+            break;
+        }
+    }
+    if total != checksum * passes {
+        eprintln!("inconsistent results for {}", name);
+        std::process::exit(1);
+    }
+    println!(
+        "{} {} {:.3} {}",
+        port,
+        name,
+        elapsed * 1e9 / (chars.len() as f64 * passes as f64),
+        checksum
+    );
+}
+
+fn main() {
+    let args: Vec<String> = std::env::args().collect();
+    if args.len() < 2 {
+        eprintln!("usage: {} MIN_SECONDS [FILE...]", args[0]);
+        std::process::exit(2);
+    }
+    let min_seconds: f64 = args[1].parse().expect("MIN_SECONDS must be a number");
+    let table = WcLookupTable::new();
+
+    let mut workloads = vec![(
+        "sweep".to_string(),
+        (0..=0x10FFFF)
+            .filter_map(char::from_u32)
+            .collect::<Vec<_>>(),
+    )];
+    for path in &args[2..] {
+        let bytes = std::fs::read(path).unwrap_or_else(|e| panic!("{}: {}", path, e));
+        let chars = bytes
+            .chunks_exact(4)
+            .map(|b| {
+                char::from_u32(u32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+                    .expect("not a codepoint")
+            })
+            .collect();
+        let name = std::path::Path::new(path)
+            .file_stem()
+            .unwrap()
+            .to_string_lossy()
+            .into_owned();
+        workloads.push((name, chars));
+    }
+    for (name, chars) in &workloads {
+        time_workload("rust", name, chars, min_seconds, WcWidth::from_char);
+        time_workload("rust-table", name, chars, min_seconds, |c| {
+            table.classify(c)
+        });
+    }
+}
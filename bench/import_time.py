@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+""" Measures how long importing widechar_width.py takes, and how much memory it allocates.
+Each measurement runs in a fresh interpreter, after one run to compile the module.
+"""
+
+import argparse
+import os.path
+import statistics
+import subprocess
+import sys
+
+# Run in a fresh interpreter, with the module directory as argv[1].
+# Prints the import time in seconds and the allocated and peak bytes.
+MEASURE = """
+import sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+trace = sys.argv[2] == "1"
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+import widechar_width
+elapsed = time.perf_counter() - start
+current, peak = tracemalloc.get_traced_memory() if trace else (0, 0)
+print(elapsed, current, peak)
+"""
+
+
+def measure(directory, trace):
+    """Import widechar_width from directory in a new interpreter.
+    Return a tuple (seconds, allocated bytes, peak bytes)."""
+    out = subprocess.run(
+        [sys.executable, "-c", MEASURE, directory, "1" if trace else "0"],
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    elapsed, current, peak = out.split()
+    return float(elapsed), int(current), int(peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        help="directory containing widechar_width.py (default: the repository)",
+    )
+    parser.add_argument("--runs", type=int, default=20, help="number of imports to time")
+    args = parser.parse_args()
+
+    measure(args.directory, False)
+    times = [measure(args.directory, False)[0] for _ in range(args.runs)]
+    _, current, peak = measure(args.directory, True)
+    print("import time:   %.2f ms (median of %d, min %.2f ms)"
+          % (statistics.median(times) * 1e3, args.runs, min(times) * 1e3))
+    print("import memory: %.1f KiB allocated, %.1f KiB peak" % (current / 1024, peak / 1024))
+
+
+if __name__ == "__main__":
+    main()
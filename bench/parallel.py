@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+""" Measures how the throughput of widths_parallel() scales with the number of workers. """
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from widechar_width import widths_parallel  # pylint: disable=wrong-import-position
+
+# Characters to build lines from: mostly ASCII, with some CJK, emoji and combining marks.
+ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyz0123456789 .:/-" * 4
+    + "日本語中文한국어テキスト"
+    + "\U0001F600\U0001F680⌚"
+    + "é"
+)
+
+
+def make_corpus(count, seed=0):
+    """Return a list of count deterministic pseudo-random lines."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(ALPHABET, k=rng.randrange(20, 120))) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200000, help="number of lines")
+    parser.add_argument("--chunksize", type=int, default=4096, help="lines per chunk")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        help="worker counts to try (default: powers of two up to the CPU count)",
+    )
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers = args.workers or sorted({1 << i for i in range(cpus.bit_length())} | {cpus})
+    corpus = make_corpus(args.lines)
+    chars = sum(map(len, corpus))
+    print("%d lines, %d characters, %d CPUs" % (len(corpus), chars, cpus))
+    print("%8s %14s %14s %8s" % ("workers", "lines/s", "chars/s", "speedup"))
+    baseline = None
+    for count in workers:
+        start = time.perf_counter()
+        for _ in widths_parallel(corpus, workers=count, chunksize=args.chunksize):
+            pass
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print("%8d %14.0f %14.0f %7.2fx"
+              % (count, len(corpus) / elapsed, chars / elapsed, baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main()
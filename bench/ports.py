@@ -0,0 +1,123 @@
+""" Times wcwidth in each generated implementation on the same workloads, and prints
+the time per lookup in one table. Run by `make bench`, which builds the C, C++ and Rust
+harnesses in bench/harness first. Node and Java are run if they are installed.
+
+The workloads are a sweep of every Unicode scalar value, and the synthetic corpora
+of `python3 -m bench`. Each port also prints the sum of its results for every workload,
+and these must agree.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from array import array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HARNESS = os.path.join(ROOT, "bench", "harness")
+sys.path.insert(0, ROOT)
+
+import widechar_width  # pylint: disable=wrong-import-position
+from bench.corpora import CORPORA, make_corpus  # pylint: disable=wrong-import-position
+
+
+def harnesses(workdir):
+    """Yield (name, command) for each port that can run here, or (name, None) with
+    the reason it cannot."""
+    for name, binary in (("cpp", "bench_cpp"), ("c", "bench_c"), ("rust", "bench_rs")):
+        path = os.path.join(HARNESS, binary)
+        if os.path.exists(path):
+            yield name, [path]
+        else:
+            yield name, "%s is not built, run `make bench`" % os.path.relpath(path, ROOT)
+
+    if shutil.which("node"):
+        yield "node", ["node", os.path.join(HARNESS, "bench.js")]
+    else:
+        yield "node", "node is not installed"
+
+    if shutil.which("javac") and shutil.which("java"):
+        # The public class in widechar_width.java is WcWidth, so javac wants that file name.
+        classes = os.path.join(workdir, "java")
+        os.mkdir(classes)
+        shutil.copy(
+            os.path.join(ROOT, "widechar_width.java"), os.path.join(classes, "WcWidth.java")
+        )
+        subprocess.run(
+            ["javac", "-d", classes, os.path.join(classes, "WcWidth.java"),
+             os.path.join(HARNESS, "Bench.java")],
+            check=True,
+        )
+        yield "java", ["java", "-cp", classes, "Bench"]
+    else:
+        yield "java", "java is not installed"
+
+    script = os.path.join(HARNESS, "bench.py")
+    yield "python", [sys.executable, script, "--pure"]
+    if widechar_width._ext:  # pylint: disable=protected-access
+        yield "python-ext", [sys.executable, script]
+    else:
+        yield "python-ext", "the C extension is not built, run `make python-ext`"
+
+
+def write_corpora(workdir, lines, seed):
+    """Write each corpus as a file of little-endian 32 bit codepoints. Return the paths."""
+    paths = []
+    for name in CORPORA:
+        codepoints = array("I", map(ord, "".join(make_corpus(name, lines, seed))))
+        if sys.byteorder == "big":
+            codepoints.byteswap()
+        path = os.path.join(workdir, name + ".u32")
+        with open(path, "wb") as f:
+            codepoints.tofile(f)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m bench.ports", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds to spend on each workload in each port (default: 0.2)")
+    parser.add_argument("--lines", type=int, default=2000, help="lines per corpus")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the corpora")
+    args = parser.parse_args()
+
+    ports, times, checksums = [], {}, {}
+    with tempfile.TemporaryDirectory() as workdir:
+        files = write_corpora(workdir, args.lines, args.seed)
+        for name, command in harnesses(workdir):
+            if isinstance(command, str):
+                print("skipping %s: %s" % (name, command), file=sys.stderr)
+                continue
+            out = subprocess.run(
+                command + [str(args.min_time)] + files, check=True, stdout=subprocess.PIPE
+            ).stdout.decode()
+            for line in out.splitlines():
+                port, workload, nanoseconds, checksum = line.split()
+                if port not in ports:
+                    ports.append(port)
+                times[port, workload] = float(nanoseconds)
+                checksums.setdefault(workload, {})[port] = int(checksum)
+
+    workloads = ["sweep"] + list(CORPORA)
+    print("ns/lookup")
+    print("%-16s" % "workload" + "".join("%12s" % port for port in ports))
+    for workload in workloads:
+        cells = [
+            "%.1f" % times[port, workload] if (port, workload) in times else "-"
+            for port in ports
+        ]
+        print("%-16s" % workload + "".join("%12s" % cell for cell in cells))
+
+    disagree = [w for w in workloads if len(set(checksums.get(w, {}).values())) > 1]
+    if disagree:
+        for workload in disagree:
+            print("ports disagree on %s: %s" % (workload, checksums[workload]), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,29 @@
 
 """ Outputs the width file to stdout. """
 
+import argparse
+import base64
 import datetime
 import hashlib
+import json
+import mmap
+import os
 import os.path
+import marshal
 import re
+import shutil
+import string
+import subprocess
 import sys
-
-from collections.abc import Iterable
-from typing import NamedTuple
+import zipfile
+import zlib
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain
+from typing import Iterator, NamedTuple
 from urllib.request import urlretrieve
 
 VERSION = "17.0.0"
@@ -51,18 +66,98 @@ WIDTH_WIDENED_IN_9 = -6
 # Private use characters.
 WIDTH_PRIVATE_USE = -7
 
-
-class CodePoint(object):  # pylint: disable=too-few-public-methods
-    """Represents a single Unicode codepoint"""
-
-    def __init__(self, codepoint):
-        self.codepoint = codepoint
-        self.width = None
-        self.category = CAT_UNASSIGNED
-
-    def hex(self):
-        """Return the codepoint as a hex string"""
-        return "0x%05X" % self.codepoint
+# The tables wcwidth() consults, in the order it consults them by default.
+# The first table containing a codepoint decides its width;
+# codepoints in none of them have width 1.
+LOOKUP_ORDER = (
+    "ascii",
+    "private",
+    "nonprint",
+    "noncharacters",
+    "combining",
+    "combiningletters",
+    "doublewide",
+    "ambiguous",
+    "unassigned",
+    "widenedin9",
+)
+
+
+# How the templates refer to a table in LOOKUP_ORDER,
+# and what wcwidth() returns for its codepoints in each language.
+class TableCheck(NamedTuple):
+    name: str  # as in widechar_{name}_table
+    c_result: str  # in C, C++ and JavaScript
+    rust_result: str  # a WcWidth variant
+    java_type: str  # a WcWidth.Type
+
+
+TABLE_CHECKS = {
+    "ascii": TableCheck("ascii", "1", "One", "ONE"),
+    "private": TableCheck("private", CPP_PREFIX + "private_use", "PrivateUse", "PRIVATE_USE"),
+    "nonprint": TableCheck("nonprint", CPP_PREFIX + "nonprint", "NonPrint", "NON_PRINT"),
+    "noncharacters": TableCheck(
+        "nonchar", CPP_PREFIX + "non_character", "NonCharacter", "NON_CHARACTER"
+    ),
+    "combining": TableCheck("combining", CPP_PREFIX + "combining", "Combining", "COMBINING"),
+    "combiningletters": TableCheck(
+        "combiningletters", CPP_PREFIX + "combining", "Combining", "COMBINING"
+    ),
+    "doublewide": TableCheck("doublewide", "2", "Two", "TWO"),
+    "ambiguous": TableCheck("ambiguous", CPP_PREFIX + "ambiguous", "Ambiguous", "AMBIGUOUS"),
+    "unassigned": TableCheck("unassigned", CPP_PREFIX + "unassigned", "Unassigned", "UNASSIGNED"),
+    "widenedin9": TableCheck("widened", CPP_PREFIX + "widened_in_9", "WidenedIn9", "WIDENED_IN_9"),
+}
+
+# The check of one table in wcwidth() for each language, see render_checks().
+CHECK_CPP = """    if ({p}in_table({p}{name}_table, c))
+        return {c_result};"""
+CHECK_C = """    if ({p}in_table({p}{name}_table, {p}ARRAY_SIZE({p}{name}_table), c)) {{
+        {p}STATS_HIT({p}table_{name});
+        return {c_result};
+    }}"""
+CHECK_RUST = """        if in_table(&{NAME}_TABLE, c) {{
+            return Self::{rust_result};
+        }}"""
+CHECK_JAVA = "{java_type}"
+
+
+# Width of codepoints that no data file gives a width.
+WIDTH_UNSET = 0
+
+
+class CodePoints:
+    """The general category and width of every codepoint, stored as columns
+    indexed by codepoint, so that ranges can be assigned with slice writes."""
+
+    def __init__(self):
+        # Names of the general categories, indexed by the ids in categories.
+        self.category_names = [CAT_UNASSIGNED]
+        self.categories = bytearray(MAX_CODEPOINT + 1)
+        self.widths = array("b", bytes(MAX_CODEPOINT + 1))
+
+    def category_id(self, name):
+        """Return the id of a general category, adding it if it is new."""
+        if name not in self.category_names:
+            self.category_names.append(name)
+        return self.category_names.index(name)
+
+    def set_category(self, first, last, name):
+        """Set the category of the codepoints from first to last inclusive."""
+        self.categories[first : last + 1] = bytes([self.category_id(name)]) * (last - first + 1)
+
+    def set_width(self, first, last, width):
+        """Set the width of the codepoints from first to last inclusive."""
+        self.widths[first : last + 1] = array("b", [width]) * (last - first + 1)
+
+    def with_categories(self, names):
+        """Return the ranges of codepoints in any of the given categories."""
+        ids = [self.category_names.index(name) for name in names if name in self.category_names]
+        return column_ranges(self.categories, ids)
+
+    def with_width(self, width):
+        """Return the ranges of codepoints with the given width."""
+        return column_ranges(self.widths.tobytes(), [width & 0xFF])
 
 
 # Settings controlling language output.
@@ -70,17 +165,22 @@ class LangSettings(NamedTuple):
     range_chars: str  # open/close characters for ranges, like "{}"
     indentation: str = "    "
     keep_last: bool = False
+    lookup_table: bool = False  # also emit a two-stage lookup table
+    table_format: str = "source"  # "source", "packed" or "compressed"
+    check: str = ""  # the check of one table in wcwidth(), if it has a chain of checks
+    check_sep: str = "\n"  # separator between checks
+    formatter: tuple = ()  # a command that formats the output in place, run if installed
 
 
 # Data parsed from unicode.org datafiles.
-# Datas are lists of lines, with comment-only lines removed.
-# Hashes are sha1 strings.
+# Datas are iterators over lines, with comment-only lines removed,
+# which can be consumed once. Hashes are sha1 strings.
 class UnicodeDatas(NamedTuple):
-    unicode_data: list[str]
+    unicode_data: Iterator[str]
     unicode_hash: str
-    eaw_data: list[str]
+    eaw_data: Iterator[str]
     eaw_hash: str
-    emoji_data: list[str]
+    emoji_data: Iterator[str]
     emoji_hash: str
 
 
@@ -89,48 +189,114 @@ def log(msg):
     sys.stderr.write(str(msg) + "\n")
 
 
-def read_datafile(url):
-    """Download a file from url to name if not already present.
-    Return the file as a tuple (lines, sha1)
-    lines will have comment-only lines removed, sha1 is a string.
+def ucd_names(url):
+    """Return the names a datafile from url may have in a UCD directory or zip:
+    its path below ucd/, like emoji/emoji-data.txt, then its base name."""
+    path = url.split("/ucd/", 1)[-1]
+    return [path, path.rsplit("/", 1)[-1]]
+
+
+@contextmanager
+def open_datafile(url, ucd_dir=None, ucd_zip=None):
+    """Open the datafile from url as a binary stream with readline().
+    It is a member of the zip ucd_zip, or a file in ucd_dir, memory-mapped.
+    If neither is given, it is a file in the current directory,
+    downloaded from url if not already present."""
+    names = ucd_names(url)
+    if ucd_zip:
+        with zipfile.ZipFile(ucd_zip) as archive:
+            members = set(archive.namelist())
+            name = next((name for name in names if name in members), names[0])
+            with archive.open(name) as stream:
+                yield stream
+        return
+    if ucd_dir:
+        candidates = [os.path.join(ucd_dir, name) for name in names]
+        path = next((path for path in candidates if os.path.isfile(path)), candidates[0])
+    else:
+        path = names[-1]
+        if not os.path.isfile(path):
+            log("Downloading " + path)
+            urlretrieve(url, path)
+    with open(path, "rb") as ifile:
+        with mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ) as stream:
+            yield stream
+
+
+def datafile_hash(url, ucd_dir=None, ucd_zip=None):
+    """Return the sha1 of a datafile, reading it in blocks."""
+    hashval = hashlib.sha1()
+    with open_datafile(url, ucd_dir, ucd_zip) as stream:
+        for block in iter(partial(stream.read, 1 << 16), b""):
+            hashval.update(block)
+    return hashval.hexdigest()
+
+
+def datafile_lines(url, ucd_dir=None, ucd_zip=None):
+    """Yield the lines of a datafile one at a time, skipping comment-only lines."""
+    with open_datafile(url, ucd_dir, ucd_zip) as stream:
+        for line in iter(stream.readline, b""):
+            if not line.startswith(b"#"):
+                yield line.decode("utf-8")
+
+
+def read_datafile(url, ucd_dir=None, ucd_zip=None):
+    """Return the datafile from url as a tuple (lines, sha1).
+    lines is an iterator over the lines without comment-only lines,
+    which reads the file only as it is consumed. sha1 is a string.
     """
-    name = url.rsplit("/", 1)[-1]
-    if not os.path.isfile(name):
-        log("Downloading " + name)
-        urlretrieve(url, name)
-    with open(name, "rb") as ofile:
-        data = ofile.read()
-    hashval = hashlib.sha1(data).hexdigest()
-    lines = data.decode("utf-8").split("\n")
-    lines = [line for line in lines if not line.startswith("#")]
-    return (lines, hashval)
-
-
-def set_general_categories(unicode_data, cps):
-    """Receives lines from UnicodeData.txt,
-    and sets general categories for codepoints."""
+    hashval = datafile_hash(url, ucd_dir, ucd_zip)
+    return (datafile_lines(url, ucd_dir, ucd_zip), hashval)
+
+
+def parse_unicode_data(unicode_data):
+    """Yield tuples (first, last, category) from lines of UnicodeData.txt,
+    merging consecutive codepoints in the same category."""
+    run = None
     for line in unicode_data:
         fields = line.strip().split(";")
-        if len(fields) > FIELD_CATEGORY:
-            for idx in hexrange_to_range(fields[FIELD_CODEPOINT]):
-                cps[idx].category = fields[FIELD_CATEGORY]
-
-
-def merged_codepoints(cps: Iterable[CodePoint]):
-    """return a list of codepoints (start, end) for inclusive ranges"""
-    cps = sorted(cps, key=lambda cp: cp.codepoint)
-    if not cps:
-        return []
-    ranges = [(cps[0], cps[0])]
-    for cp in cps[1:]:
-        last_range = ranges[-1]
-        if cp.codepoint == last_range[1].codepoint + 1:
-            ranges[-1] = (last_range[0], cp)
+        if len(fields) <= FIELD_CATEGORY:
+            continue
+        first, last = hexrange_to_interval(fields[FIELD_CODEPOINT])
+        category = fields[FIELD_CATEGORY]
+        if run and run[1] + 1 == first and run[2] == category:
+            run = (run[0], last, category)
             continue
-        ranges.append((cp, cp))
+        if run:
+            yield run
+        run = (first, last, category)
+    if run:
+        yield run
+
+
+def set_general_categories(unicode_data, cps: CodePoints):
+    """Receives lines from UnicodeData.txt,
+    and sets general categories for codepoints."""
+    for (first, last, category) in parse_unicode_data(unicode_data):
+        cps.set_category(first, last, category)
+
+
+def column_ranges(column, values):
+    """Given a bytes-like column indexed by codepoint, return a list of
+    inclusive ranges (start, end) of the codepoints whose byte is in values."""
+    wanted = bytes(1 if byte in values else 0 for byte in range(256))
+    mask = bytes(column).translate(wanted)
+    ranges = []
+    start = mask.find(1)
+    while start >= 0:
+        end = mask.find(0, start)
+        if end < 0:
+            end = len(mask)
+        ranges.append((start, end - 1))
+        start = mask.find(1, end)
     return ranges
 
 
+def hex_codepoint(codepoint):
+    """Return a codepoint as a hex string"""
+    return "0x%05X" % codepoint
+
+
 def gen_seps(length, indentation, keep_last):
     """Yield separators for a table of given length"""
     table_columns = 1
@@ -143,40 +309,158 @@ def gen_seps(length, indentation, keep_last):
             yield ", "
 
 
-def codepoints_to_carray_str(settings: LangSettings, cps: Iterable[CodePoint]):
-    """Given a list of codepoints, return a C array string representing their inclusive ranges."""
-    result = ""
-    ranges = merged_codepoints(cps)
+def ranges_to_carray_rows(settings: LangSettings, ranges):
+    """Given a list of ranges from column_ranges(),
+    yield the rows of a C array representing them."""
     seps = gen_seps(len(ranges), settings.indentation, settings.keep_last)
     for (start, end) in ranges:
-        result += "%s%s, %s%s%s" % (
+        yield "%s%s, %s%s%s" % (
             settings.range_chars[0],
-            start.hex(),
-            end.hex(),
+            hex_codepoint(start),
+            hex_codepoint(end),
             settings.range_chars[1],
             next(seps),
         )
-    return result
 
 
-def hexrange_to_range(hexrange):
+def lookup_classes(ranges):
+    """Given a dictionary of ranges from column_ranges(), keyed by table name,
+    return a bytearray mapping each codepoint to the index in LOOKUP_ORDER
+    of the first table containing it, or len(LOOKUP_ORDER) if none does."""
+    classes = bytearray([len(LOOKUP_ORDER)]) * (MAX_CODEPOINT + 1)
+    # Fill in reverse order, so earlier tables overwrite later ones.
+    for idx in reversed(range(len(LOOKUP_ORDER))):
+        for (start, end) in ranges[LOOKUP_ORDER[idx]]:
+            classes[start : end + 1] = bytes([idx]) * (end - start + 1)
+    return classes
+
+
+def disjoint_ranges(classes):
+    """Given the bytearray from lookup_classes(), return a dictionary of ranges
+    like those of column_ranges(), keyed by table name, where each codepoint
+    is only in the first table in LOOKUP_ORDER that contains it."""
+    return {name: column_ranges(classes, [idx]) for idx, name in enumerate(LOOKUP_ORDER)}
+
+
+def profiled_order(classes, profile):
+    """Given the bytearray from lookup_classes() and a dictionary of counts
+    keyed by codepoint, return LOOKUP_ORDER sorted by the total count of the
+    codepoints that each table decides, highest first."""
+    hits = [0] * (len(LOOKUP_ORDER) + 1)
+    for codepoint, count in profile.items():
+        hits[classes[codepoint]] += count
+    return sorted(LOOKUP_ORDER, key=lambda name: -hits[LOOKUP_ORDER.index(name)])
+
+
+def render_checks(settings: LangSettings, order):
+    """Return the checks of the tables in wcwidth(), in the given order.
+    Checks that come out the same, like the Java type of both combining tables,
+    are only emitted the first time."""
+    checks = []
+    for name in order:
+        info = TABLE_CHECKS[name]
+        check = settings.check.format(p=CPP_PREFIX, NAME=info.name.upper(), **info._asdict())
+        if check not in checks:
+            checks.append(check)
+    return settings.check_sep.join(checks)
+
+
+def read_profile(path):
+    """Read a codepoint frequency profile. Each line holds a codepoint in hex,
+    optionally prefixed with U+, and how often it occurs. Text after # is ignored.
+    Return a dictionary of counts keyed by codepoint."""
+    profile = {}
+    with open(path) as ifile:
+        for lineno, line in enumerate(ifile, 1):
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            try:
+                codepoint, count = fields
+                if codepoint[:2].upper() == "U+":
+                    codepoint = codepoint[2:]
+                codepoint, count = int(codepoint, 16), int(count)
+            except ValueError:
+                codepoint = -1
+            if not 0 <= codepoint <= MAX_CODEPOINT:
+                raise ValueError("%s:%d: expected a codepoint and a count" % (path, lineno))
+            profile[codepoint] = profile.get(codepoint, 0) + count
+    return profile
+
+
+def two_stage_table(classes):
+    """Compress a per-codepoint bytearray into a two-stage lookup table.
+    Codepoints are split into blocks of 2**shift; identical blocks are stored once.
+    Return a tuple (shift, stage1, stage2) such that the value for codepoint c is
+    stage2[(stage1[c >> shift] << shift) | (c & ((1 << shift) - 1))].
+    The block size is picked to minimize the total size,
+    with the constraint that stage1 fits in bytes.
+    """
+    best = None
+    for shift in range(4, 12):
+        size = 1 << shift
+        blocks = {}
+        stage1 = bytearray()
+        for base in range(0, len(classes), size):
+            idx = blocks.setdefault(bytes(classes[base : base + size]), len(blocks))
+            if idx > 0xFF:
+                break
+            stage1.append(idx)
+        else:
+            stage2 = b"".join(blocks)
+            if best is None or len(stage1) + len(stage2) < len(best[1]) + len(best[2]):
+                best = (shift, bytes(stage1), stage2)
+    return best
+
+
+def quoted_lines(text, indentation, per_line=64):
+    """Yield text as a sequence of quoted string literals, one per line."""
+    for idx in range(0, len(text), per_line):
+        yield ("\n" + indentation if idx else "") + '"%s"' % text[idx : idx + per_line]
+
+
+def packed_table(prefix, data, table_format):
+    """Yield the source of a packed or compressed table of data,
+    wrapped in parentheses after prefix."""
+    yield prefix + "(\n    "
+    yield from quoted_lines(pack_bytes(data, table_format), "    ")
+    yield "\n)"
+
+
+def pack_bytes(data, table_format):
+    """Return data as text for a packed or compressed table.
+    Packed tables are hex, compressed tables are zlib-compressed and base64-encoded."""
+    if table_format == "compressed":
+        return base64.b64encode(zlib.compress(data, 9)).decode("ascii")
+    return data.hex()
+
+
+def pack_ranges(ranges):
+    """Return the inclusive ranges from column_ranges()
+    as bytes of little-endian 32 bit ints, alternating start and end."""
+    result = bytearray()
+    for (start, end) in ranges:
+        result += start.to_bytes(4, "little")
+        result += end.to_bytes(4, "little")
+    return bytes(result)
+
+
+def hexrange_to_interval(hexrange):
     """Given a string like 1F300..1F320 representing an inclusive range,
-    return the range of codepoints.
-    If the string is like 1F321, return a range of just that element.
+    return a tuple (first, last) of its codepoints.
+    If the string is like 1F321, first and last are the same.
     """
     fields = [int(val, 16) for val in hexrange.split("..")]
-    if len(fields) == 1:
-        fields += fields
-    return range(fields[0], fields[1] + 1)
+    return (fields[0], fields[-1])
 
 
 def parse_eaw_line(eaw_line):
-    """Return a list of tuples (codepoint, width) from an EAW line"""
+    """Return a tuple (first, last, width) from an EAW line, or None"""
     # Remove hash.
     line = eaw_line.split("#", 1)[0]
     fields = line.strip().split(";")
     if len(fields) != 2:
-        return []
+        return None
     cps, width_type = [x.strip() for x in fields]
     # width_types:
     #  A: ambiguous, F: fullwidth, H: halfwidth,
@@ -187,14 +471,15 @@ def parse_eaw_line(eaw_line):
         width = 2
     else:
         width = 1
-    return [(cp, width) for cp in hexrange_to_range(cps)]
+    return hexrange_to_interval(cps) + (width,)
 
 
-def set_eaw_widths(eaw_data_lines, cps):
+def set_eaw_widths(eaw_data_lines, cps: CodePoints):
     """Read from EastAsianWidth.txt, set width values on the codepoints"""
     for line in eaw_data_lines:
-        for (cp, width) in parse_eaw_line(line):
-            cps[cp].width = width
+        parsed = parse_eaw_line(line)
+        if parsed:
+            cps.set_width(*parsed)
     # Apply the following special cases:
     #  - The unassigned code points in the following blocks default to "W":
     #         CJK Unified Ideographs Extension A: U+3400..U+4DBF
@@ -211,18 +496,18 @@ def set_eaw_widths(eaw_data_lines, cps):
         (0x20000, 0x2FFFD),
         (0x30000, 0x3FFFD),
     ]
-    for wr in wide_ranges:
-        for cp in range(wr[0], wr[1] + 1):
-            if cps[cp].width is None:
-                cps[cp].width = 2
+    widths = cps.widths.tobytes()
+    for (first, last) in wide_ranges:
+        for (start, end) in column_ranges(widths[first : last + 1], [WIDTH_UNSET]):
+            cps.set_width(first + start, first + end, 2)
 
 
 def parse_emoji_line(line):
-    """Return a list {cp, version} for the line"""
+    """Return a tuple (first, last, version, property) for the line, or None"""
     # Example line: 0023   ; Emoji #  1.1  [1] (#)  number sign
     fields_comment = line.split("#", 1)
     if len(fields_comment) != 2:
-        return []
+        return None
     fields, comment = fields_comment
     cps, prop = fields.split(";")
     prop = prop.strip()
@@ -230,28 +515,35 @@ def parse_emoji_line(line):
     # Some code points are marked "reserved" and do not have a version "NA".
     fmtre = re.search(r"^\s*E\d+\.\d+", comment)
     version = float(fmtre.group(0).strip()[1:]) if fmtre else 0.0
-    return [(cp, version, prop) for cp in hexrange_to_range(cps)]
+    return hexrange_to_interval(cps) + (version, prop)
 
 
-def set_emoji_widths(emoji_data_lines, cps):
+def set_emoji_widths(emoji_data_lines, cps: CodePoints):
     """Read from emoji-data.txt, set codepoint widths"""
     for line in emoji_data_lines:
-        for (cp, version, prop) in parse_emoji_line(line):
-            # The Regional Indicators are special
-            if cp in range(0x1F1E6, 0x1F200):
-                continue
+        parsed = parse_emoji_line(line)
+        if not parsed:
+            continue
+        first, last, version, prop = parsed
+
+        # We only care about emoji *presentation*.
+        # Other codepoints should be rendered as text by default,
+        # so their EAW width applies.
+        if prop != "Emoji_Presentation":
+            continue
+
+        # If this emoji was introduced before Unicode 9, then it was widened in 9.
+        # The version we get here is the *Emoji* version.
+        # Before Unicode 11 this was different, Unicode 9 shipped with Emoji 3.0.
+        width = 2 if version >= 3.0 else WIDTH_WIDENED_IN_9
 
-            # We only care about emoji *presentation*.
-            # Other codepoints should be rendered as text by default,
-            # so their EAW width applies.
-            if prop == "Emoji_Presentation":
-                # If this emoji was introduced before Unicode 9, then it was widened in 9.
-                # The version we get here is the *Emoji* version.
-                # Before Unicode 11 this was different, Unicode 9 shipped with Emoji 3.0.
-                cps[cp].width = 2 if version >= 3.0 else WIDTH_WIDENED_IN_9
+        # The Regional Indicators 1F1E6..1F1FF are special, leave them out.
+        for (start, end) in ((first, min(last, 0x1F1E5)), (max(first, 0x1F200), last)):
+            if start <= end:
+                cps.set_width(start, end, width)
 
 
-def set_hardcoded_ranges(cps):
+def set_hardcoded_ranges(cps: CodePoints):
     """Mark private use and surrogate codepoints"""
     # Private use can be determined awkwardly from UnicodeData.txt,
     # but we just hard-code them.
@@ -259,13 +551,11 @@ def set_hardcoded_ranges(cps):
     # so as to match wcwidth9().
     private_ranges = [(0xE000, 0xF8FF), (0xF0000, 0xFFFFD), (0x100000, 0x10FFFD)]
     for (first, last) in private_ranges:
-        for idx in range(first, last + 1):
-            cps[idx].category = CAT_PRIVATE_USE
+        cps.set_category(first, last, CAT_PRIVATE_USE)
 
     surrogate_ranges = [(0xD800, 0xDBFF), (0xDC00, 0xDFFF)]
     for (first, last) in surrogate_ranges:
-        for idx in range(first, last + 1):
-            cps[idx].category = CAT_SURROGATE
+        cps.set_category(first, last, CAT_SURROGATE)
 
     # See "noncharacters" discussion at https://www.unicode.org/faq/private_use.html
     # "Last two code points of each of the 16 supplementary planes" and also BMP (plane 0).
@@ -275,23 +565,24 @@ def set_hardcoded_ranges(cps):
         nonchar_ranges.append((c, c + 1))
 
     for (first, last) in nonchar_ranges:
-        for idx in range(first, last + 1):
-            cps[idx].category = CAT_NON_CHARACTERS
+        cps.set_category(first, last, CAT_NON_CHARACTERS)
 
 
-def read_datas():
-    """Read our three Unicode files, and return a UnicodeDatas."""
-    unicode_data, unicode_hash = read_datafile(UNICODE_DATA_URL)
-    eaw_data, eaw_hash = read_datafile(EAW_URL)
-    emoji_data, emoji_hash = read_datafile(EMOJI_DATA_URL)
+def read_datas(ucd_dir=None, ucd_zip=None):
+    """Read our three Unicode files, and return a UnicodeDatas.
+    They are read from the directory ucd_dir or the zip ucd_zip if given,
+    and downloaded to the current directory otherwise."""
+    unicode_data, unicode_hash = read_datafile(UNICODE_DATA_URL, ucd_dir, ucd_zip)
+    eaw_data, eaw_hash = read_datafile(EAW_URL, ucd_dir, ucd_zip)
+    emoji_data, emoji_hash = read_datafile(EMOJI_DATA_URL, ucd_dir, ucd_zip)
     return UnicodeDatas(
         unicode_data, unicode_hash, eaw_data, eaw_hash, emoji_data, emoji_hash
     )
 
 
 def make_codepoints(datas: UnicodeDatas):
-    """Given a UnicodeDatas, return a list of CodePoints."""
-    cps = [CodePoint(i) for i in range(MAX_CODEPOINT + 1)]
+    """Given a UnicodeDatas, return the CodePoints."""
+    cps = CodePoints()
     set_general_categories(datas.unicode_data, cps)
     set_eaw_widths(datas.eaw_data, cps)
     set_emoji_widths(datas.emoji_data, cps)
@@ -299,33 +590,32 @@ def make_codepoints(datas: UnicodeDatas):
     return cps
 
 
-def make_fields(
-    datas: UnicodeDatas,
-    cps: list[CodePoint],
-    settings: LangSettings,
-    template_hash: str,
-    generate_hash: str,
-    filename,
-):
-    """Return a dictionary of fields, ready to be plugged into a template string."""
-    log("Thinking...")
+# The tables for every language, computed once from the Unicode data.
+# Renderers only format these.
+class Tables(NamedTuple):
+    # Ranges from column_ranges(), keyed by table name, in LOOKUP_ORDER.
+    ranges: dict
+    # The ranges for a chain of checks in wcwidth(), in the order of check_order.
+    # These are the same as ranges unless a profile reordered the checks,
+    # in which case they are disjoint.
+    check_ranges: dict
+    check_order: tuple
+    # The two-stage lookup table from two_stage_table().
+    stage_shift: int
+    stage1: bytes
+    stage2: bytes
+    unicode_hash: str
+    eaw_hash: str
+    emoji_hash: str
 
-    def categories(cats):
-        """Return a carray string of codepoints in any of the given categories."""
-        catset = set(cats)
-        matches = [cp for cp in cps if cp.category in catset]
-        return codepoints_to_carray_str(settings, matches)
 
-    def codepoints_with_width(width):
-        """Return a carray string of codepoints with the given width."""
-        return codepoints_to_carray_str(
-            settings, (cp for cp in cps if cp.width == width)
-        )
+def make_tables(datas: UnicodeDatas, cps: CodePoints, profile=None):
+    """Return the Tables for the given data. If a profile from read_profile()
+    is given, the table checks in wcwidth() are ordered by it."""
+    log("Thinking...")
 
-    # A carray string of ASCII codepoints."
-    ascii_codepoints = codepoints_to_carray_str(
-        settings, (cp for cp in cps if 0x20 <= cp.codepoint < 0x7F)
-    )
+    # ASCII codepoints.
+    ascii_ranges = [(0x20, 0x7E)]
 
     # A decomposed Hangul syllable is a grapheme that consists of up to three
     # code points. The first code point has width 2. The rest consists of
@@ -334,41 +624,222 @@ def make_fields(
     # wcwidth(), will compute string widths different from the intended width
     # (2).  Work around this by forcing width 0 for these characters. This
     # matches glibc and others.
-    combiningletters = codepoints_to_carray_str(
-        settings,
-        (
-            cp
-            for cp in cps
-            if (
-                (cp.codepoint >= 0x1160 and cp.codepoint <= 0x11FF)
-                or (cp.codepoint >= 0xD7B0 and cp.codepoint <= 0xD7FF)
-            )
-        ),
+    combiningletters_ranges = [(0x1160, 0x11FF), (0xD7B0, 0xD7FF)]
+
+    ranges = {
+        "ascii": ascii_ranges,
+        "private": cps.with_categories([CAT_PRIVATE_USE]),
+        "noncharacters": cps.with_categories([CAT_NON_CHARACTERS]),
+        "nonprint": cps.with_categories(["Cc", "Cf", "Zl", "Zp", CAT_SURROGATE]),
+        "combining": cps.with_categories(["Mn", "Mc", "Me"]),
+        "combiningletters": combiningletters_ranges,
+        "doublewide": cps.with_width(2),
+        "unassigned": cps.with_categories([CAT_UNASSIGNED]),
+        "ambiguous": cps.with_width(WIDTH_AMBIGUOUS_EASTASIAN),
+        "widenedin9": cps.with_width(WIDTH_WIDENED_IN_9),
+    }
+    classes = lookup_classes(ranges)
+
+    check_ranges, check_order = ranges, LOOKUP_ORDER
+    if profile:
+        # Checking the tables in a different order only gives the same results
+        # if no codepoint is in more than one of them.
+        check_ranges = disjoint_ranges(classes)
+        check_order = tuple(profiled_order(classes, profile))
+
+    shift, stage1, stage2 = two_stage_table(classes)
+    return Tables(
+        ranges,
+        check_ranges,
+        check_order,
+        shift,
+        stage1,
+        stage2,
+        datas.unicode_hash,
+        datas.eaw_hash,
+        datas.emoji_hash,
     )
 
+
+def make_fields(
+    tables: Tables,
+    settings: LangSettings,
+    template_hash: str,
+    generate_hash: str,
+    filename,
+):
+    """Return a dictionary of fields, ready to be plugged into a template by
+    render_template(). Large fields are functions returning their fragments."""
     fields = {
         "p": CPP_PREFIX,
         "filename": filename,
         "unicode_version": VERSION,
         "generate_hash": generate_hash,
         "template_hash": template_hash,
-        "unicode_hash": datas.unicode_hash,
-        "eaw_hash": datas.eaw_hash,
-        "emoji_hash": datas.emoji_hash,
-        "ascii": ascii_codepoints,
-        "private": categories([CAT_PRIVATE_USE]),
-        "noncharacters": categories([CAT_NON_CHARACTERS]),
-        "nonprint": categories(["Cc", "Cf", "Zl", "Zp", CAT_SURROGATE]),
-        "combining": categories(["Mn", "Mc", "Me"]),
-        "combiningletters": combiningletters,
-        "doublewide": codepoints_with_width(2),
-        "unassigned": categories([CAT_UNASSIGNED]),
-        "ambiguous": codepoints_with_width(WIDTH_AMBIGUOUS_EASTASIAN),
-        "widenedin9": codepoints_with_width(WIDTH_WIDENED_IN_9),
+        "unicode_hash": tables.unicode_hash,
+        "eaw_hash": tables.eaw_hash,
+        "emoji_hash": tables.emoji_hash,
     }
+    ranges = tables.check_ranges if settings.check else tables.ranges
+    if settings.table_format == "source":
+        for name, table in ranges.items():
+            fields[name] = partial(ranges_to_carray_rows, settings, table)
+        fields["packed_tables"] = "None"
+    else:
+        # Pack all tables into one blob, and refer to them by offset and count.
+        packed = []
+        offset = 0
+        for name, table in ranges.items():
+            fields[name] = "%d, %d" % (offset, len(table))
+            packed.append(pack_ranges(table))
+            offset += len(table)
+        packed = b"".join(packed)
+        fields["packed_tables"] = partial(packed_table, "", packed, settings.table_format)
+    fields["table_format"] = settings.table_format
+    if settings.check:
+        fields["checks"] = render_checks(settings, tables.check_order)
+        # How many tables wcwidth() probes for a codepoint in each table, in
+        # LOOKUP_ORDER, and for one in none of them.
+        fields["check_probes"] = ", ".join(
+            [str(tables.check_order.index(name) + 1) for name in LOOKUP_ORDER]
+            + [str(len(LOOKUP_ORDER))]
+        )
+
+    if settings.lookup_table:
+        unpack = "_decompress" if settings.table_format == "compressed" else "bytes.fromhex"
+        fields["stage_shift"] = tables.stage_shift
+        fields["stage_mask"] = hex((1 << tables.stage_shift) - 1)
+        for name, stage in (("stage1", tables.stage1), ("stage2", tables.stage2)):
+            fields[name] = partial(packed_table, unpack, stage, settings.table_format)
+    # Identifies the tables, so widechar_width.py can tell if the C extension
+    # was generated from the same data.
+    fields["stage_digest"] = hashlib.sha1(tables.stage1 + tables.stage2).hexdigest()
     return fields
 
 
+def cache_key(*parts):
+    """Return a hex digest identifying a sequence of strings."""
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class Cache:
+    """A cache of computed Tables, and of the outputs written from them,
+    in a directory. Both are keyed by the hashes of everything they depend on."""
+
+    MANIFEST = "outputs.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        try:
+            with open(os.path.join(directory, self.MANIFEST)) as ifile:
+                self.outputs = json.load(ifile)
+        except (OSError, ValueError):
+            self.outputs = {}
+
+    def load_tables(self, key):
+        """Return the Tables stored under key, or None."""
+        try:
+            with open(os.path.join(self.directory, "tables-%s.marshal" % key), "rb") as ifile:
+                return Tables(*marshal.load(ifile))
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def store_tables(self, key, tables: Tables):
+        """Store tables under key."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, "tables-%s.marshal" % key), "wb") as ofile:
+            marshal.dump(tuple(tables), ofile)
+
+    def is_current(self, output, key):
+        """Return whether output was last written from inputs with the given key,
+        and has not changed since."""
+        if self.outputs.get(output, {}).get("key") != key:
+            return False
+        return file_sha1(output) == self.outputs[output]["sha1"]
+
+    def record(self, output, key, sha1):
+        """Record that output holds content with the given sha1,
+        rendered from inputs with the given key."""
+        self.outputs[output] = {"key": key, "sha1": sha1}
+
+    def save(self):
+        """Write the record of outputs to the directory."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, self.MANIFEST), "w") as ofile:
+            json.dump(self.outputs, ofile, indent=1, sort_keys=True)
+
+
+def render_template(template, fields):
+    """Yield the fragments of template with fields filled in, like
+    template.format(**fields). A field may be a function returning an
+    iterable of fragments, which are yielded as they are produced."""
+    for literal, name, spec, _ in string.Formatter().parse(template):
+        if literal:
+            yield literal
+        if name is None:
+            continue
+        value = fields[name]
+        if callable(value):
+            yield from value()
+        else:
+            yield format(value, spec)
+
+
+def file_sha1(path):
+    """Return the sha1 of the file at path, or None if it cannot be read."""
+    hashval = hashlib.sha1()
+    try:
+        with open(path, "rb") as ifile:
+            for block in iter(partial(ifile.read, 1 << 16), b""):
+                hashval.update(block)
+    except OSError:
+        return None
+    return hashval.hexdigest()
+
+
+def write_if_changed(path, fragments, formatter=()):
+    """Write the fragments to path as they are produced, unless path already
+    holds exactly that. If the formatter command is installed, the content is
+    formatted with it first. Return a tuple (sha1 of the content, whether it was written)."""
+    temp = path + ".tmp"
+    with open(temp, "w", encoding="utf-8") as ofile:
+        for fragment in fragments:
+            ofile.write(fragment)
+    if formatter and shutil.which(formatter[0]):
+        subprocess.run(list(formatter) + [temp], check=True)
+    sha1 = file_sha1(temp)
+    if file_sha1(path) == sha1:
+        os.remove(temp)
+        return sha1, False
+    os.replace(temp, path)
+    return sha1, True
+
+
+def lang_settings(python_tables="source"):
+    """Return the LangSettings of each output, keyed by the suffix of its template.
+    python_tables is the table_format of widechar_width.py."""
+    return {
+        ".h": LangSettings("{}", check=CHECK_CPP),
+        "_c.h": LangSettings("{}", check=CHECK_C),
+        ".js": LangSettings("[]", check=CHECK_CPP),
+        ".py": LangSettings("()", "    " * 2, True, True, python_tables),
+        # Formatted, so that `make rust` running rustfmt does not change it.
+        ".rs": LangSettings("()", check=CHECK_RUST, formatter=("rustfmt",)),
+        ".java": LangSettings("{}", "    " * 2, check=CHECK_JAVA, check_sep=", "),
+        "_ext.c": LangSettings("{}"),
+    }
+
+
+def render_output(tables: Tables, generate_hash, job):
+    """Render one output from tables and write it if it changed.
+    job is a tuple (output, settings, template, template_hash).
+    Return a tuple (sha1, written)."""
+    output, settings, template, template_hash = job
+    fields = make_fields(tables, settings, template_hash, generate_hash, output)
+    fragments = chain(render_template(template.strip(), fields), "\n")
+    return write_if_changed(output, fragments, settings.formatter)
+
+
 def gitobjecthash(data):
     """Generate the git object hash of a bit of data
     like `git hash-object`
@@ -379,35 +850,98 @@ def gitobjecthash(data):
     return h.hexdigest()
 
 
+def parse_args(argv):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--python-tables",
+        choices=["source", "packed", "compressed"],
+        default="source",
+        help="How to store the tables in widechar_width.py: as tuples in source, "
+        "as one packed blob, or as one zlib-compressed blob (default: %(default)s). "
+        "Packed tables are unpacked on first use, and compressed ones make the "
+        "module smallest and quickest to import.",
+    )
+    parser.add_argument(
+        "--profile",
+        help="A codepoint frequency profile: lines of a hex codepoint and a count. "
+        "The tables are checked in wcwidth() in order of how many of the profiled "
+        "codepoints they decide, instead of the default order. Results are unchanged.",
+    )
+    ucd = parser.add_mutually_exclusive_group()
+    ucd.add_argument(
+        "--ucd-dir",
+        help="Read the Unicode data files from this directory, such as an unpacked "
+        "UCD.zip, instead of downloading them to the current directory.",
+    )
+    ucd.add_argument(
+        "--ucd-zip",
+        help="Read the Unicode data files from this zip, such as UCD.zip, "
+        "without unpacking it, instead of downloading them.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".widechar_cache",
+        help="Where to keep the computed tables, keyed by the hashes of their inputs, "
+        "so unchanged outputs are neither rendered nor rewritten (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not read or write the cache."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="How many outputs to render at once, each in its own process "
+        "(default: %(default)s). The outputs are the same for any number.",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    profile = read_profile(args.profile) if args.profile else None
     with open(__file__, "rb") as oof:
         data = oof.read()
     generate_hash = gitobjecthash(data)
-    datas = read_datas()
-    cps = make_codepoints(datas)
-    langs = {
-        # Suffix: Braces, indentation, keep the last comma
-        ".h": ("{}",),
-        "_c.h": ("{}",),
-        ".js": ("[]",),
-        ".py": ("()", "    " * 2, True),
-        ".rs": ("()",),
-        ".java": ("{}", "    " * 2),
-    }
+    datas = read_datas(args.ucd_dir, args.ucd_zip)
+    cache = None if args.no_cache else Cache(args.cache_dir)
+    tables_key = cache_key(
+        generate_hash,
+        datas.unicode_hash,
+        datas.eaw_hash,
+        datas.emoji_hash,
+        repr(sorted(profile.items())) if profile else "",
+    )
+    langs = lang_settings(args.python_tables)
+    # Outputs to render, as (output, settings, template, template_hash, output_key).
+    stale = []
     for suffix, settings in langs.items():
         with open("templates/template" + suffix) as templatefile:
             template = templatefile.read()
-            template_hash = gitobjecthash(template.encode("utf-8"))
-            output = "widechar_width" + suffix
-            fields = make_fields(
-                datas,
-                cps,
-                LangSettings(*settings),
-                template_hash,
-                generate_hash,
-                output,
-            )
-            with open(output, "w") as fd:
-                fd.write(template.strip().format(**fields))
-                fd.write("\n")
-                log("Output " + output)
+        template_hash = gitobjecthash(template.encode("utf-8"))
+        output = "widechar_width" + suffix
+        output_key = cache_key(tables_key, template_hash, repr(settings))
+        if cache and cache.is_current(output, output_key):
+            log("Unchanged " + output)
+            continue
+        stale.append((output, settings, template, template_hash, output_key))
+    if stale:
+        tables = cache.load_tables(tables_key) if cache else None
+        if tables is None:
+            tables = make_tables(datas, make_codepoints(datas), profile)
+            if cache:
+                cache.store_tables(tables_key, tables)
+        render = partial(render_output, tables, generate_hash)
+        jobs = [job[:4] for job in stale]
+        if args.jobs > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(min(args.jobs, len(jobs))) as pool:
+                results = list(pool.map(render, jobs))
+        else:
+            results = [render(job) for job in jobs]
+        for (output, _, _, _, output_key), (sha1, written) in zip(stale, results):
+            log(("Output " if written else "Unchanged ") + output)
+            if cache:
+                cache.record(output, output_key, sha1)
+    if cache:
+        cache.save()
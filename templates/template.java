@@ -39,6 +39,9 @@ public class WcWidth {{
         UNASSIGNED(0, UNASSIGNED_TABLE),                        // The character is unassigned.
         WIDENED_IN_9(2, WIDENED_IN_9_TABLE);                    // Width is 1 in Unicode 8, 2 in Unicode 9+.
 
+        // The types in the order that of() checks them.
+        private static final Type[] CHECK_ORDER = {{{checks}}};
+
         private final int defaultWidth;
         private final int[][][] tables;
 
@@ -80,10 +83,10 @@ public class WcWidth {{
 
         public static Type of(int c) {{
             if (c < 0 || c > 0x10FFFF) {{
-                throw new IllegalArgumentException(format("'0x%X' is not a Unicode code point", c))
+                throw new IllegalArgumentException(format("'0x%X' is not a Unicode code point", c));
             }}
 
-            return Stream.of(Type.values())
+            return Stream.of(CHECK_ORDER)
                     .filter(type -> type.contains(c))
                     .findFirst()
                     .orElse(ONE);
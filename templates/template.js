@@ -109,25 +109,6 @@ function {p}wcwidth(c) {{
     if (c < 0 || c > 0x10FFFF)
         throw new RangeError("Argument must be inside Unicode code point range (0-U+10FFFF).");
 
-    if ({p}in_table({p}ascii_table, c))
-        return 1;
-    if ({p}in_table({p}private_table, c))
-        return {p}private_use;
-    if ({p}in_table({p}nonprint_table, c))
-        return {p}nonprint;
-    if ({p}in_table({p}nonchar_table, c))
-        return {p}non_character;
-    if ({p}in_table({p}combining_table, c))
-        return {p}combining;
-    if ({p}in_table({p}combiningletters_table, c))
-        return {p}combining;
-    if ({p}in_table({p}doublewide_table, c))
-        return 2;
-    if ({p}in_table({p}ambiguous_table, c))
-        return {p}ambiguous;
-    if ({p}in_table({p}unassigned_table, c))
-        return {p}unassigned;
-    if ({p}in_table({p}widened_table, c))
-        return {p}widened_in_9;
+{checks}
     return 1;
 }}
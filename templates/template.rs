@@ -108,36 +108,7 @@ impl WcWidth {{
     /// Return the width of character c
     pub fn from_char(c: char) -> Self {{
         let c = c as u32;
-        if in_table(&ASCII_TABLE, c) {{
-            return Self::One;
-        }}
-        if in_table(&PRIVATE_TABLE, c) {{
-            return Self::PrivateUse;
-        }}
-        if in_table(&NONPRINT_TABLE, c) {{
-            return Self::NonPrint;
-        }}
-        if in_table(&NONCHAR_TABLE, c) {{
-            return Self::NonCharacter;
-        }}
-        if in_table(&COMBINING_TABLE, c) {{
-            return Self::Combining;
-        }}
-        if in_table(&COMBININGLETTERS_TABLE, c) {{
-            return Self::Combining;
-        }}
-        if in_table(&DOUBLEWIDE_TABLE, c) {{
-            return Self::Two;
-        }}
-        if in_table(&AMBIGUOUS_TABLE, c) {{
-            return Self::Ambiguous;
-        }}
-        if in_table(&UNASSIGNED_TABLE, c) {{
-            return Self::Unassigned;
-        }}
-        if in_table(&WIDENED_TABLE, c) {{
-            return Self::WidenedIn9;
-        }}
+{checks}
         Self::One
     }}
 
@@ -122,29 +122,101 @@ static inline bool widechar_in_table(const struct {p}range* arr, size_t len, uin
 
 
 
+/*
+ * Lookup statistics. Define WIDECHAR_WIDTH_STATS, for example with
+ * -DWIDECHAR_WIDTH_STATS, to count which table resolved each lookup and how
+ * many tables were probed. Define WIDECHAR_WIDTH_STATS_LATENCY as well to
+ * collect a histogram of lookup times, which uses C11 timespec_get. Without
+ * them the counting compiles to nothing. The counters are not thread safe.
+ */
+#if defined(WIDECHAR_WIDTH_STATS_LATENCY) && !defined(WIDECHAR_WIDTH_STATS)
+#define WIDECHAR_WIDTH_STATS
+#endif
+
+/* The tables wcwidth checks, then the default for characters in none of them. */
+enum {{
+  {p}table_ascii,
+  {p}table_private,
+  {p}table_nonprint,
+  {p}table_nonchar,
+  {p}table_combining,
+  {p}table_combiningletters,
+  {p}table_doublewide,
+  {p}table_ambiguous,
+  {p}table_unassigned,
+  {p}table_widened,
+  {p}table_default,
+  {p}table_count
+}};
+
+#define {p}LATENCY_BUCKETS 32
+
+struct {p}stats {{
+  uint64_t lookups;
+  uint64_t hits[{p}table_count];   // Lookups resolved by each table.
+  uint64_t probes[{p}table_count]; // Lookups by the number of tables probed.
+  // Lookups by duration: bucket i counts those under 2^i ns and at least 2^(i-1) ns.
+  uint64_t latency_ns[{p}LATENCY_BUCKETS];
+}};
+
+#ifdef WIDECHAR_WIDTH_STATS
+static struct {p}stats {p}stats_counters;
+
+/* The number of tables wcwidth probes to resolve a lookup from each table. */
+static const unsigned char {p}table_probes[{p}table_count] = {{{check_probes}}};
+
+#define {p}STATS_HIT(table)                                                              \
+  ({p}stats_counters.lookups++, {p}stats_counters.hits[table]++,                         \
+   {p}stats_counters.probes[{p}table_probes[table]]++)
+
+/* Copy the counters into *out. */
+void {p}stats_snapshot(struct {p}stats *out) {{
+    *out = {p}stats_counters;
+}}
+
+/* Set the counters to zero. */
+void {p}stats_reset(void) {{
+    struct {p}stats zero = {{0}};
+    {p}stats_counters = zero;
+}}
+#else
+#define {p}STATS_HIT(table) ((void)0)
+#endif
+
+#ifdef WIDECHAR_WIDTH_STATS_LATENCY
+#include <time.h>
+
+static int {p}wcwidth_untimed(uint32_t c);
+
+/* Return the width of character c, or a special negative value, and record the time it took. */
+int {p}wcwidth(uint32_t c) {{
+    struct timespec start, end;
+    uint64_t ns;
+    int bucket = 0;
+    int result;
+    timespec_get(&start, TIME_UTC);
+    result = {p}wcwidth_untimed(c);
+    timespec_get(&end, TIME_UTC);
+    ns = (uint64_t)(end.tv_sec - start.tv_sec) * 1000000000u + end.tv_nsec - start.tv_nsec;
+    while (bucket < {p}LATENCY_BUCKETS - 1 && (ns >> bucket) != 0)
+        bucket++;
+    {p}stats_counters.latency_ns[bucket]++;
+    return result;
+}}
+
+/* The definition below is the untimed lookup. */
+#define {p}wcwidth {p}wcwidth_untimed
+#endif
+
 /* Return the width of character c, or a special negative value. */
 int {p}wcwidth(uint32_t c) {{
-    if ({p}in_table({p}ascii_table, {p}ARRAY_SIZE({p}ascii_table), c))
-        return 1;
-    if ({p}in_table({p}private_table, {p}ARRAY_SIZE({p}private_table), c))
-        return {p}private_use;
-    if ({p}in_table({p}nonprint_table, {p}ARRAY_SIZE({p}nonprint_table), c))
-        return {p}nonprint;
-    if ({p}in_table({p}nonchar_table, {p}ARRAY_SIZE({p}nonchar_table), c))
-        return {p}non_character;
-    if ({p}in_table({p}combining_table, {p}ARRAY_SIZE({p}combining_table), c))
-        return {p}combining;
-    if ({p}in_table({p}combiningletters_table, {p}ARRAY_SIZE({p}combiningletters_table), c))
-        return {p}combining;
-    if ({p}in_table({p}doublewide_table, {p}ARRAY_SIZE({p}doublewide_table), c))
-        return 2;
-    if ({p}in_table({p}ambiguous_table, {p}ARRAY_SIZE({p}ambiguous_table), c))
-        return {p}ambiguous;
-    if ({p}in_table({p}unassigned_table, {p}ARRAY_SIZE({p}unassigned_table), c))
-        return {p}unassigned;
-    if ({p}in_table({p}widened_table, {p}ARRAY_SIZE({p}widened_table), c))
-        return {p}widened_in_9;
+{checks}
+    {p}STATS_HIT({p}table_default);
     return 1;
 }}
 
+#ifdef WIDECHAR_WIDTH_STATS_LATENCY
+#undef {p}wcwidth
+#endif
+
 #endif // WIDECHAR_WIDTH_H
@@ -331,9 +331,47 @@ int run_tests(void) {
     return ret;
 }
 
+#ifdef WIDECHAR_WIDTH_STATS
+// Check the lookup counters against a few known characters.
+int run_stats_tests(void) {
+    struct widechar_stats stats;
+    int ret = 0;
+    uint64_t total = 0;
+    widechar_stats_reset();
+    widechar_wcwidth('a');
+    widechar_wcwidth(0x4E00);
+    widechar_wcwidth(0x4E01);
+    widechar_wcwidth(0x2716);
+    widechar_stats_snapshot(&stats);
+    // In the default order ASCII is the first check and doublewide the seventh,
+    // and a codepoint in no table is found after all ten.
+    // ProfileTest in test.py covers the probe counts of a profiled order.
+    if (stats.lookups != 4 || stats.hits[widechar_table_ascii] != 1 ||
+        stats.hits[widechar_table_doublewide] != 2 || stats.hits[widechar_table_default] != 1 ||
+        stats.probes[1] != 1 || stats.probes[7] != 2 || stats.probes[10] != 1) {
+        printf("Unexpected lookup counters\n");
+        ret = EXIT_FAILURE;
+    }
+#ifdef WIDECHAR_WIDTH_STATS_LATENCY
+    for (int i = 0; i < widechar_LATENCY_BUCKETS; i++) {
+        total += stats.latency_ns[i];
+    }
+    if (total != stats.lookups) {
+        printf("Unexpected latency histogram\n");
+        ret = EXIT_FAILURE;
+    }
+#endif
+    (void)total;
+    return ret;
+}
+#endif
+
 int main(void) {
     int ret = 0;
     ret |= run_tests();
+#ifdef WIDECHAR_WIDTH_STATS
+    ret |= run_stats_tests();
+#endif
     printf("Tests %s\n", ret == EXIT_SUCCESS ? "passed" : "failed");
     return ret;
 }
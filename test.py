@@ -0,0 +1,693 @@
+#!/usr/bin/env python3
+
+""" Tests for the generated widechar_width.py. """
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import generate
+import widechar_width
+from widechar_width import (
+    _TABLE,
+    Codepointrange,
+    DEFAULT_POLICY,
+    Special,
+    WidthIndex,
+    async_line_widths,
+    center,
+    format_table,
+    line_widths,
+    ljust,
+    make_wcwidth,
+    rjust,
+    slice_columns,
+    truncate,
+    wcswidth,
+    wcwidth,
+    wcwidth_array,
+    widths_parallel,
+    wrap,
+)
+
+# The tables checked by reference_wcwidth(), in order, and their results.
+REFERENCE_ORDER = [
+    ("ascii", 1),
+    ("private", Special.private_use),
+    ("nonprint", Special.nonprint),
+    ("nonchar", Special.non_character),
+    ("combining", Special.combining),
+    ("combiningletters", Special.combining),
+    ("doublewide", 2),
+    ("ambiguous", Special.ambiguous),
+    ("unassigned", Special.unassigned),
+    ("widened", Special.widened_in_9),
+]
+
+
+def reference_wcwidth(c):
+    """The width of codepoint c, by checking each range table in turn."""
+    for name, result in REFERENCE_ORDER:
+        if c in _TABLE[name]:
+            return result
+    return 1
+
+
+# A few lines of each Unicode data file, laid out as in UCD.zip.
+TINY_UCD = {
+    "UnicodeData.txt": (
+        "0041;LATIN CAPITAL LETTER A;Lu;0;L;;;;;N;;;;0061;\n"
+        "0300;COMBINING GRAVE ACCENT;Mn;230;NSM;;;;;N;NON-SPACING GRAVE;;;;\n"
+        "231A;WATCH;So;0;ON;;;;;N;;;;;\n"
+        "4E00;<CJK Ideograph, First>;Lo;0;L;;;;;N;;;;;\n"
+        "9FFF;<CJK Ideograph, Last>;Lo;0;L;;;;;N;;;;;\n"
+        "E000;<Private Use, First>;Co;0;L;;;;;N;;;;;\n"
+        "F8FF;<Private Use, Last>;Co;0;L;;;;;N;;;;;\n"
+    ),
+    "EastAsianWidth.txt": (
+        "# EastAsianWidth.txt\n"
+        "0041;Na          # Lu         LATIN CAPITAL LETTER A\n"
+        "00A1;A           # Po         INVERTED EXCLAMATION MARK\n"
+        "231A..231B;W     # So     [2] WATCH..HOURGLASS\n"
+        "4E00..9FFF;W     # Lo [20992] CJK UNIFIED IDEOGRAPH-4E00..CJK UNIFIED IDEOGRAPH-9FFF\n"
+    ),
+    "emoji/emoji-data.txt": (
+        "# emoji-data.txt\n"
+        "\n"
+        "231A..231B    ; Emoji_Presentation   # E0.6   [2] (\u231a..\u231b)    watch..hourglass\n"
+    ),
+}
+
+
+def write_tiny_ucd(directory):
+    """Write TINY_UCD to directory."""
+    for name, text in TINY_UCD.items():
+        path = os.path.join(directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as ofile:
+            ofile.write(text)
+
+
+class WcwidthTest(unittest.TestCase):
+    def test_all_codepoints(self):
+        for c in range(0x110000):
+            if wcwidth(c) != reference_wcwidth(c):
+                self.fail("Mismatch for U+%04X: %r, expected %r"
+                          % (c, wcwidth(c), reference_wcwidth(c)))
+
+    def test_samples(self):
+        self.assertEqual(wcwidth("a"), 1)
+        self.assertEqual(wcwidth("一"), 2)
+        self.assertEqual(wcwidth("́"), Special.combining)
+        self.assertEqual(wcwidth(0xE000), Special.private_use)
+        self.assertEqual(wcwidth(0xFFFF), Special.non_character)
+        self.assertEqual(wcwidth(0), Special.nonprint)
+
+    def test_array(self):
+        widths = wcwidth_array(range(0x110000))
+        for c in range(0x110000):
+            expected = wcwidth(c)
+            if isinstance(expected, Special):
+                expected = expected.value
+            if widths[c] != expected:
+                self.fail("Mismatch for U+%04X: %r, expected %r" % (c, widths[c], expected))
+        self.assertRaises(ValueError, wcwidth_array, [0x110000])
+        self.assertRaises(ValueError, wcwidth_array, [-1])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, wcwidth, "ab")
+        self.assertRaises(ValueError, wcwidth, -1)
+        self.assertRaises(ValueError, wcwidth, 0x110000)
+        self.assertRaises(ValueError, wcwidth, 2**70)
+        self.assertRaises(ValueError, wcwidth, -(2**70))
+
+
+@unittest.skipIf(widechar_width._ext is None, "C extension not built or disabled")
+class ExtensionTest(unittest.TestCase):
+    def test_wcwidth(self):
+        for c in range(0x110000):
+            if wcwidth(c) != widechar_width._py_wcwidth(c):
+                self.fail("Mismatch for U+%04X" % c)
+        self.assertRaises(ValueError, wcwidth, "ab")
+        self.assertRaises(ValueError, wcwidth, 0x110000)
+        self.assertRaises(ValueError, wcwidth, 2**70)
+
+    def test_pure_fallback(self):
+        strings = ["日本語 text", "e\u0301\u231a\x00\uE000", "plain"]
+        policy = {Special.widened_in_9: 1, Special.private_use: 2}
+        with_ext = [wcswidth(s, policy) for s in strings]
+        array_ext = list(wcwidth_array(range(0x110000)))
+        ext, widechar_width._ext = widechar_width._ext, None
+        try:
+            self.assertEqual([wcswidth(s, policy) for s in strings], with_ext)
+            self.assertEqual(list(wcwidth_array(range(0x110000))), array_ext)
+        finally:
+            widechar_width._ext = ext
+
+
+class WcswidthTest(unittest.TestCase):
+    def reference(self, s, policy=DEFAULT_POLICY):
+        widths = [wcwidth(c) for c in s]
+        return sum(policy[w] if isinstance(w, Special) else w for w in widths)
+
+    def test_strings(self):
+        for s in ["", "hello", "tab\there", "日本語 text", "e\u0301\u0301", "\U0001F600!",
+                  "\u231A\uE000\uFFFF\u0378", "\x00\x7f\u00ad"]:
+            self.assertEqual(wcswidth(s), self.reference(s), repr(s))
+
+    def test_policy(self):
+        policy = dict(DEFAULT_POLICY)
+        policy[Special.widened_in_9] = 1
+        policy[Special.ambiguous] = 2
+        s = "\u231A\u00A1x"
+        self.assertEqual(wcswidth(s, {Special.widened_in_9: 1, Special.ambiguous: 2}),
+                         self.reference(s, policy))
+        self.assertEqual(wcswidth(s), 4)
+        self.assertEqual(wcswidth("\u231a", {-6: 1}), 1)
+        self.assertRaises(ValueError, wcswidth, "\u231a", {-8: 1})
+        self.assertRaises(ValueError, wcswidth, "\u231a", {"widened_in_9": 1})
+        self.assertRaises(ValueError, wrap, "\u231a", 2, {2: 1})
+
+
+class WidthsParallelTest(unittest.TestCase):
+    def test_order(self):
+        strings = ["日本語" * (i % 7) + "x" * (i % 5) for i in range(5000)]
+        expected = [wcswidth(s) for s in strings]
+        self.assertEqual(list(widths_parallel(strings, workers=2, chunksize=64)), expected)
+        self.assertEqual(list(widths_parallel(iter(strings), workers=1)), expected)
+        self.assertEqual(list(widths_parallel([], workers=2)), [])
+
+    def test_policy(self):
+        policy = {Special.widened_in_9: 1}
+        self.assertEqual(list(widths_parallel(["\u231a"], workers=2, policy=policy)), [1])
+
+
+class LayoutTest(unittest.TestCase):
+    def test_truncate(self):
+        self.assertEqual(truncate("hello world", 8), "hello w…")
+        self.assertEqual(truncate("hello", 5), "hello")
+        self.assertEqual(truncate("ab日本語", 6), "ab日…")
+        self.assertEqual(truncate("ab日本語", 5, "..."), "ab...")
+        self.assertEqual(truncate("ae\u0301\u0301bc", 3, ""), "ae\u0301\u0301b")
+        self.assertEqual(truncate("ae\u0301bc", 2, ""), "ae\u0301")
+        self.assertEqual(truncate("日本", 1), "…")
+        self.assertEqual(truncate("日本", 1, "..."), "")
+
+    def test_justify(self):
+        self.assertEqual(ljust("日本", 6), "日本  ")
+        self.assertEqual(rjust("日本", 6, "."), "..日本")
+        self.assertEqual(center("日本", 7), " 日本  ")
+        self.assertEqual(ljust("日本語", 4), "日本語")
+
+    def test_wrap(self):
+        self.assertEqual(
+            wrap("the quick brown fox jumps", 10), ["the quick", "brown fox", "jumps"]
+        )
+        self.assertEqual(
+            wrap("日本語のテキスト", 5), ["日本", "語の", "テキ", "スト"]
+        )
+        self.assertEqual(wrap("abcdefghij kl", 4), ["abcd", "efgh", "ij", "kl"])
+        self.assertEqual(wrap("ab\n\ncd", 4), ["ab", "", "cd"])
+        self.assertEqual(wrap("日", 1), ["日"])
+        self.assertEqual(wrap("ae\u0301bc", 2), ["ae\u0301", "bc"])
+        # Spaces at a break are dropped with the zero-width characters after them.
+        self.assertEqual(wrap("aa \u0301", 2), ["aa"])
+        self.assertEqual(wrap("aa \u0301 b", 2), ["aa", "b"])
+        self.assertEqual(wrap("a\u0301 \u0301", 1), ["a\u0301"])
+        for text in ["a \u0301b  c\u0301 \u0301d", "日 \u0301本 \u200b語", "x\u0301 " * 5]:
+            for cols in range(1, 8):
+                for line in wrap(text, cols):
+                    self.assertLessEqual(wcswidth(line), max(cols, 2), (text, cols))
+
+    def test_format_table(self):
+        rows = [["name", "qty"], ["日本語", "3"], ["apple", "12345"], ["é"]]
+        self.assertEqual(
+            format_table(rows, align=["<", ">"]),
+            ["name      qty", "日本語      3", "apple   12345", "é            "],
+        )
+        self.assertEqual(
+            format_table(rows, max_widths=[4, None], sep="|"),
+            ["name|qty", "日… |3", "app…|12345", "é   |"],
+        )
+        self.assertEqual(format_table([["a", "bc"], ["xyz", "d"]], align=["^", "^"]),
+                         [" a   bc", "xyz  d "])
+        self.assertEqual(format_table([]), [])
+
+    def test_slice_columns(self):
+        s = "ab日本語e\u0301fg"
+        self.assertEqual(slice_columns(s, 0, 3), "ab ")
+        self.assertEqual(slice_columns(s, 3, 6), " 本")
+        self.assertEqual(slice_columns(s, 3, 7), " 本 ")
+        self.assertEqual(slice_columns(s, 2, 4), "日")
+        self.assertEqual(slice_columns(s, 3, 4), " ")
+        self.assertEqual(slice_columns(s, 8, 9), "e\u0301")
+        self.assertEqual(slice_columns(s, 9), "fg")
+        self.assertEqual(slice_columns(s, 20, 30), "")
+        self.assertEqual(slice_columns("hello", 1, 3), "el")
+        for start in range(12):
+            for end in range(start, 12):
+                self.assertEqual(
+                    wcswidth(slice_columns(s, start, end)), min(end, 11) - min(start, 11)
+                )
+        # Negative columns are treated as 0, with or without the ASCII fast path.
+        self.assertEqual(slice_columns("hello", -2), "hello")
+        self.assertEqual(slice_columns("hello", -2, 2), "he")
+        self.assertEqual(slice_columns("日本", -1), "日本")
+        self.assertEqual(slice_columns("日本", 0, -1), "")
+
+
+class WidthIndexTest(unittest.TestCase):
+    def check(self, index, text):
+        self.assertEqual(str(index), text)
+        self.assertEqual(len(index), len(text))
+        self.assertEqual(index.width, wcswidth(text))
+        columns = [wcswidth(text[:offset]) for offset in range(len(text) + 1)]
+        for offset, column in enumerate(columns):
+            self.assertEqual(index.column_of(offset), column)
+        for column in range(columns[-1] + 2):
+            expected = len(text)
+            for offset in range(len(text)):
+                if columns[offset] <= column < columns[offset + 1]:
+                    expected = offset
+                    break
+            self.assertEqual(index.offset_of(column), expected)
+
+    def test_small(self):
+        index = WidthIndex("ab日本e\u0301x")
+        self.assertEqual(index.width, 8)
+        self.assertEqual(index.offset_of(3), 2)
+        self.assertEqual(index.offset_of(7), 6)
+        self.check(index, "ab日本e\u0301x")
+        self.check(WidthIndex(), "")
+        self.assertRaises(IndexError, index.column_of, 9)
+        self.assertRaises(ValueError, WidthIndex, "", {Special.nonprint: -1})
+
+    def test_edits(self):
+        rng = random.Random(42)
+        alphabet = "ab 日本\u0301\U0001F600"
+        text = ""
+
+        class SmallChunks(WidthIndex):
+            CHUNK_SIZE = 4
+
+        index = SmallChunks()
+        for _ in range(300):
+            start = rng.randrange(len(text) + 1)
+            if rng.random() < 0.6:
+                piece = "".join(rng.choices(alphabet, k=rng.randrange(1, 12)))
+                index.insert(start, piece)
+                text = text[:start] + piece + text[start:]
+            else:
+                end = rng.randrange(start, len(text) + 1)
+                index.delete(start, end)
+                text = text[:start] + text[end:]
+            self.check(index, text)
+
+
+class LineWidthsTest(unittest.TestCase):
+    def test_lines(self):
+        data = "a\tb\n日本\r\nxyz\rab\n\n\tx\u0301".encode("utf-8")
+        expected = [9, 4, 3, 0, 9]
+        self.assertEqual(list(line_widths(io.BytesIO(data))), expected)
+        # Chunk boundaries may split UTF-8 sequences.
+        chunks = [data[i : i + 1] for i in range(len(data))]
+        self.assertEqual(list(line_widths(chunks)), expected)
+        self.assertEqual(list(line_widths(io.BytesIO(data), chunk_size=3)), expected)
+
+    def test_options(self):
+        self.assertEqual(list(line_widths([b"\tx\n"], tabsize=4)), [5])
+        self.assertEqual(list(line_widths([b"a\tx\n"], tabsize=0)), [2])
+        self.assertEqual(list(line_widths([b"a\tx\n"], tabsize=-1)), [2])
+        policy = {Special.widened_in_9: 1}
+        self.assertEqual(list(line_widths(["\u231a\n".encode()], policy=policy)), [1])
+        self.assertEqual(list(line_widths([b"\xffa"])), [2])
+        self.assertEqual(list(line_widths([b"", b"x\n"])), [1])
+        self.assertEqual(list(line_widths([])), [])
+
+
+class AsyncLineWidthsTest(unittest.TestCase):
+    def collect(self, chunks, **kwargs):
+        async def run():
+            reader = asyncio.StreamReader()
+            for chunk in chunks:
+                reader.feed_data(chunk)
+            reader.feed_eof()
+            return [item async for item in async_line_widths(reader, **kwargs)]
+
+        return asyncio.run(run())
+
+    def test_lines(self):
+        data = "a\tb\n日本\r\nxyz\rab\n\n\tx".encode("utf-8")
+        expected = [("a\tb", 9), ("日本\r", 4), ("xyz\rab", 3), ("", 0), ("\tx", 9)]
+        self.assertEqual(self.collect([data]), expected)
+        self.assertEqual(self.collect([data[:7], data[7:]], chunk_size=3), expected)
+        self.assertEqual(self.collect([b"a\tx\n"], tabsize=0), [("a\tx", 2)])
+
+    def test_executor(self):
+        line = "日本語" * 3000
+        data = (line + "\n").encode("utf-8") * 3
+        self.assertEqual(self.collect([data]), [(line, 18000)] * 3)
+
+
+class MakeWcwidthTest(unittest.TestCase):
+    def test_policies(self):
+        default = make_wcwidth()
+        narrow = make_wcwidth(widened_in_9=1, nonprint=-1)
+        policy = dict(DEFAULT_POLICY)
+        policy[Special.widened_in_9] = 1
+        policy[Special.nonprint] = -1
+        for c in range(0x110000):
+            expected = wcwidth(c)
+            if isinstance(expected, Special):
+                self.assertEqual(default(c), DEFAULT_POLICY[expected])
+                self.assertEqual(narrow(c), policy[expected])
+            else:
+                self.assertEqual(default(c), expected)
+                self.assertEqual(narrow(c), expected)
+        self.assertEqual(default("一"), 2)
+        self.assertRaises(ValueError, default, 0x110000)
+
+    def test_cached(self):
+        self.assertIs(make_wcwidth(ambiguous=2), make_wcwidth(ambiguous=2))
+        self.assertIs(make_wcwidth(), make_wcwidth(ambiguous=1))
+        self.assertIs(make_wcwidth(2, 0), make_wcwidth(nonprint=2))
+
+
+class CodepointrangeTest(unittest.TestCase):
+    def random_range(self, rng):
+        ranges = []
+        for _ in range(rng.randrange(8)):
+            start = rng.randrange(200)
+            ranges.append((start, start + rng.randrange(20)))
+        return Codepointrange(*ranges)
+
+    def expand(self, cpr):
+        return {c for c in range(300) if c in cpr}
+
+    def test_contains(self):
+        cpr = Codepointrange((10, 20), (5, 12), (30, 30), (21, 25))
+        self.assertEqual(cpr.ranges, [(5, 25), (30, 30)])
+        self.assertEqual(self.expand(cpr), set(range(5, 26)) | {30})
+        self.assertNotIn(0, Codepointrange())
+
+    def test_set_operations(self):
+        rng = random.Random(1234)
+        for _ in range(500):
+            left, right = self.random_range(rng), self.random_range(rng)
+            lset, rset = self.expand(left), self.expand(right)
+            self.assertEqual(self.expand(left | right), lset | rset)
+            self.assertEqual(self.expand(left & right), lset & rset)
+            self.assertEqual(self.expand(left - right), lset - rset)
+            # Results are normalized, so equal sets compare equal.
+            self.assertEqual(left - right, Codepointrange(*(left - right)))
+            self.assertEqual(left & right, Codepointrange(*(left & right)))
+
+    def test_tables(self):
+        wide_combining = _TABLE["doublewide"] & _TABLE["combining"]
+        for c in range(0x110000):
+            if c in wide_combining:
+                self.assertIn(c, _TABLE["combining"])
+                self.assertIn(c, _TABLE["doublewide"])
+
+
+@unittest.skipUnless(numpy, "numpy not installed")
+class NumpyArrayTest(unittest.TestCase):
+    def test_vectorized(self):
+        widths = wcwidth_array(numpy.arange(0x110000, dtype=numpy.uint32))
+        self.assertIsInstance(widths, numpy.ndarray)
+        self.assertEqual(widths.dtype, numpy.int8)
+        expected = [
+            width.value if isinstance(width, Special) else width
+            for width in map(wcwidth, range(0x110000))
+        ]
+        self.assertEqual(widths.tolist(), expected)
+        self.assertEqual(wcwidth_array(numpy.array([0x4E00, 0x41], dtype=numpy.int64)).tolist(),
+                         [2, 1])
+        self.assertRaises(ValueError, wcwidth_array, numpy.array([0x110000]))
+        self.assertRaises(ValueError, wcwidth_array, numpy.array([-1]))
+
+
+class ProfileTest(unittest.TestCase):
+    """Checks that generate.py --profile reorders the table checks
+    without changing any width."""
+
+    def setUp(self):
+        self.ranges = {
+            name: _TABLE[generate.TABLE_CHECKS[name].name].ranges
+            for name in generate.LOOKUP_ORDER
+        }
+        self.classes = generate.lookup_classes(self.ranges)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "profile.txt")
+            with open(path, "w") as ofile:
+                ofile.write("# CJK text\nU+4E00 100\n4e01 50  # one\n\n1F600 20\n41 3\n")
+            self.profile = generate.read_profile(path)
+            with open(path, "w") as ofile:
+                ofile.write("4E00 100\n110000 1\n")
+            self.assertRaises(ValueError, generate.read_profile, path)
+
+    def test_read_profile(self):
+        self.assertEqual(self.profile, {0x4E00: 100, 0x4E01: 50, 0x1F600: 20, 0x41: 3})
+
+    def test_same_widths(self):
+        order = generate.profiled_order(self.classes, self.profile)
+        self.assertEqual(sorted(order), sorted(generate.LOOKUP_ORDER))
+        self.assertEqual(order[:3], ["doublewide", "widenedin9", "ascii"])
+
+        # Checking the disjoint tables in the profiled order finds, for every
+        # codepoint, the same table as checking the full ones in the default order.
+        check_ranges = generate.disjoint_ranges(self.classes)
+        classes = bytearray([len(generate.LOOKUP_ORDER)]) * len(self.classes)
+        for name in reversed(order):
+            idx = generate.LOOKUP_ORDER.index(name)
+            for (start, end) in check_ranges[name]:
+                classes[start : end + 1] = bytes([idx]) * (end - start + 1)
+        self.assertEqual(classes, self.classes)
+        covered = sum(end - start + 1 for table in check_ranges.values() for start, end in table)
+        self.assertEqual(covered, len(self.classes) - self.classes.count(len(order)))
+
+        # The generated checks follow the profiled order.
+        settings = generate.LangSettings("{}", check=generate.CHECK_C)
+        checks = generate.render_checks(settings, order)
+        positions = [
+            checks.index("table_%s)" % generate.TABLE_CHECKS[name].name) for name in order
+        ]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_check_probes(self):
+        order = tuple(generate.profiled_order(self.classes, self.profile))
+        check_ranges = generate.disjoint_ranges(self.classes)
+        tables = generate.Tables(
+            self.ranges, check_ranges, order, *generate.two_stage_table(self.classes), "", "", ""
+        )
+        settings = generate.LangSettings("{}", check=generate.CHECK_C)
+        fields = generate.make_fields(tables, settings, "", "", "widechar_width_c.h")
+        probes = [int(n) for n in fields["check_probes"].split(", ")]
+        # A codepoint in a table is found by the check of that table in order,
+        # and one in none of them after all the checks.
+        self.assertEqual(probes[:-1], [order.index(name) + 1 for name in generate.LOOKUP_ORDER])
+        self.assertEqual(probes[-1], len(order))
+        by_name = dict(zip(generate.LOOKUP_ORDER, probes))
+        self.assertEqual(by_name["doublewide"], 1)
+        self.assertEqual(by_name["widenedin9"], 2)
+        self.assertEqual(by_name["ascii"], 3)
+
+
+class CacheTest(unittest.TestCase):
+    """Checks that generate.py only rewrites outputs that changed."""
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_dir = os.path.join(tmpdir.name, "cache")
+        self.output = os.path.join(tmpdir.name, "output.txt")
+        cache = generate.Cache(self.cache_dir)
+        sha1, written = generate.write_if_changed(self.output, iter(["a", "b"]))
+        self.assertTrue(written)
+        cache.record(self.output, "key", sha1)
+        cache.save()
+        self.cache = generate.Cache(self.cache_dir)
+
+    def test_current(self):
+        self.assertTrue(self.cache.is_current(self.output, "key"))
+        self.assertFalse(self.cache.is_current(self.output, "other key"))
+        self.assertFalse(generate.Cache(self.cache_dir + "2").is_current(self.output, "key"))
+
+    def test_hand_edit(self):
+        with open(self.output, "a") as ofile:
+            ofile.write("c")
+        self.assertFalse(self.cache.is_current(self.output, "key"))
+
+    def test_deleted(self):
+        os.remove(self.output)
+        self.assertFalse(self.cache.is_current(self.output, "key"))
+
+    def test_unchanged(self):
+        os.utime(self.output, ns=(0, 0))
+        sha1, written = generate.write_if_changed(self.output, iter(["ab"]))
+        self.assertFalse(written)
+        self.assertEqual(sha1, self.cache.outputs[self.output]["sha1"])
+        self.assertEqual(os.stat(self.output).st_mtime_ns, 0)
+        self.assertFalse(os.path.exists(self.output + ".tmp"))
+
+    def test_formatter(self):
+        # Like rustfmt: formats the file named by its last argument in place.
+        upper = "import sys; p = sys.argv[1]; s = open(p).read(); open(p, 'w').write(s.upper())"
+        formatter = (sys.executable, "-c", upper)
+        sha1, written = generate.write_if_changed(self.output, iter(["ab"]), formatter)
+        self.assertTrue(written)
+        self.assertEqual(sha1, generate.file_sha1(self.output))
+        with open(self.output) as ifile:
+            self.assertEqual(ifile.read(), "AB")
+        rewritten = generate.write_if_changed(self.output, iter(["ab"]), formatter)
+        self.assertEqual(rewritten, (sha1, False))
+
+    def test_tables(self):
+        ranges = {"ascii": [(0x20, 0x7E)]}
+        tables = generate.Tables(
+            ranges, ranges, ("ascii",), 7, b"\0\1", b"\2", "unicode", "eaw", "emoji"
+        )
+        self.assertIsNone(self.cache.load_tables("key"))
+        self.cache.store_tables("key", tables)
+        self.assertEqual(self.cache.load_tables("key"), tables)
+        with open(os.path.join(self.cache_dir, "tables-bad.marshal"), "wb") as ofile:
+            ofile.write(b"\xff")
+        self.assertIsNone(self.cache.load_tables("bad"))
+
+
+class JobsTest(unittest.TestCase):
+    """Checks that generate.py writes the same outputs in parallel."""
+
+    def generate(self, tmpdir, jobs):
+        """Run generate.py on TINY_UCD with the given --jobs,
+        and return the contents of the outputs by name."""
+        outdir = os.path.join(tmpdir, "jobs%d" % jobs)
+        templates = os.path.join(os.path.dirname(os.path.abspath(generate.__file__)), "templates")
+        shutil.copytree(templates, os.path.join(outdir, "templates"))
+        command = [
+            sys.executable,
+            os.path.abspath(generate.__file__),
+            "--ucd-dir",
+            os.path.join(tmpdir, "ucd"),
+            "--no-cache",
+            "--jobs",
+            str(jobs),
+        ]
+        subprocess.run(command, cwd=outdir, check=True, stderr=subprocess.DEVNULL)
+        outputs = {}
+        for name in os.listdir(outdir):
+            if name.startswith("widechar_width"):
+                with open(os.path.join(outdir, name), "rb") as ifile:
+                    outputs[name] = ifile.read()
+        return outputs
+
+    def test_same_outputs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_tiny_ucd(os.path.join(tmpdir, "ucd"))
+            sequential = self.generate(tmpdir, 1)
+            self.assertEqual(len(sequential), 7)
+            self.assertEqual(self.generate(tmpdir, 2), sequential)
+
+
+class UcdSourceTest(unittest.TestCase):
+    """Checks that --ucd-dir and --ucd-zip read the same data."""
+
+    def test_dir_and_zip(self):
+        urls = [generate.UNICODE_DATA_URL, generate.EAW_URL, generate.EMOJI_DATA_URL]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ucd_dir = os.path.join(tmpdir, "ucd")
+            write_tiny_ucd(ucd_dir)
+            ucd_zip = os.path.join(tmpdir, "UCD.zip")
+            with zipfile.ZipFile(ucd_zip, "w") as archive:
+                for name in TINY_UCD:
+                    archive.write(os.path.join(ucd_dir, name), name)
+            for url, name in zip(urls, TINY_UCD):
+                text = TINY_UCD[name]
+                expected = [line for line in text.splitlines(True) if not line.startswith("#")]
+                sha1 = hashlib.sha1(text.encode("utf-8")).hexdigest()
+                lines, hashval = generate.read_datafile(url, ucd_dir=ucd_dir)
+                self.assertEqual((list(lines), hashval), (expected, sha1))
+                lines, hashval = generate.read_datafile(url, ucd_zip=ucd_zip)
+                self.assertEqual((list(lines), hashval), (expected, sha1))
+            tables = []
+            for source in [{"ucd_dir": ucd_dir}, {"ucd_zip": ucd_zip}]:
+                datas = generate.read_datas(**source)
+                with contextlib.redirect_stderr(io.StringIO()):
+                    tables.append(generate.make_tables(datas, generate.make_codepoints(datas)))
+            self.assertEqual(tables[0], tables[1])
+
+
+class RenderTemplateTest(unittest.TestCase):
+    """Checks that render_template fills in the templates like str.format."""
+
+    def test_templates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_tiny_ucd(tmpdir)
+            datas = generate.read_datas(ucd_dir=tmpdir)
+            with contextlib.redirect_stderr(io.StringIO()):
+                tables = generate.make_tables(datas, generate.make_codepoints(datas))
+        templates = os.path.join(os.path.dirname(os.path.abspath(generate.__file__)), "templates")
+        for python_tables in ["source", "packed", "compressed"]:
+            for suffix, settings in generate.lang_settings(python_tables).items():
+                with open(os.path.join(templates, "template" + suffix)) as ifile:
+                    template = ifile.read()
+                fields = generate.make_fields(tables, settings, "t", "g", "widechar_width" + suffix)
+                values = {
+                    name: "".join(value()) if callable(value) else value
+                    for name, value in fields.items()
+                }
+                rendered = "".join(generate.render_template(template, fields))
+                self.assertEqual(rendered, template.format(**values), suffix)
+
+
+class StatsTest(unittest.TestCase):
+    def tearDown(self):
+        widechar_width.disable_stats()
+
+    def test_counts(self):
+        original = widechar_width.wcwidth
+        widechar_width.enable_stats()
+        self.assertIsNot(widechar_width.wcwidth, original)
+        for c in ["a", "b", 0x4E00, "\u4e01", "\u2716", "\u0301"]:
+            self.assertEqual(widechar_width.wcwidth(c), original(c))
+        self.assertRaises(ValueError, widechar_width.wcwidth, 0x110000)
+        stats = widechar_width.stats_snapshot()
+        self.assertEqual(stats["lookups"], 6)
+        self.assertEqual(stats["tables"]["ascii"], 2)
+        self.assertEqual(stats["tables"]["doublewide"], 2)
+        self.assertEqual(stats["tables"]["combining"], 1)
+        self.assertEqual(stats["tables"]["default"], 1)
+        self.assertEqual(stats["probes"], {1: 2, 5: 1, 7: 2, 10: 1})
+        self.assertIsNone(stats["latency_ns"])
+
+        widechar_width.disable_stats()
+        self.assertIs(widechar_width.wcwidth, original)
+        widechar_width.wcwidth("a")
+        self.assertEqual(widechar_width.stats_snapshot()["lookups"], 6)
+
+    def test_latency(self):
+        widechar_width.enable_stats(latency=True)
+        widechar_width.enable_stats(latency=True)
+        for c in "日本語 text":
+            widechar_width.wcwidth(c)
+        stats = widechar_width.stats_snapshot()
+        self.assertEqual(stats["lookups"], 8)
+        self.assertEqual(sum(stats["latency_ns"].values()), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,8 +11,8 @@
  *  The other hashes are simple `sha1sum` style hashes.
  *  )
  *
- *  generate.py:         b35da43f176cc0d5880c67356ebb064048c5bac4
- *  template.js:         1249763c5b7c1e308aeb4ca64f1e15bce1fab9b3
+ *  generate.py:         4fd007b14cfdafa9061039befcf51ce643ad14bf
+ *  template.js:         3d79ea7432f0c0a31a4941333c9b98d186f0577d
  *  UnicodeData.txt:     50dffef1b7d1f97b72e4c2adceb9b2245f0f34ba
  *  EastAsianWidth.txt:  2cadc5034b6206ad84b75898a1d4186bb38fc12b
  *  emoji-data.txt:      3d123e12f70f63e609c4281ce83dfdd9ac7443d2
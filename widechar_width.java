@@ -16,8 +16,8 @@ import static java.lang.String.format;
  * )
  *
  * <ul>
- * <li>generate.py:         b35da43f176cc0d5880c67356ebb064048c5bac4</li>
- * <li>template.java:       3206337b3848230ac342d2d6b5baad3a8ed5e750</li>
+ * <li>generate.py:         4fd007b14cfdafa9061039befcf51ce643ad14bf</li>
+ * <li>template.java:       01180ac803f5b2ac4518cceab094bc3440f88edb</li>
  * <li>UnicodeData.txt:     50dffef1b7d1f97b72e4c2adceb9b2245f0f34ba</li>
  * <li>EastAsianWidth.txt:  2cadc5034b6206ad84b75898a1d4186bb38fc12b</li>
  * <li>emoji-data.txt:      3d123e12f70f63e609c4281ce83dfdd9ac7443d2</li>
@@ -39,6 +39,9 @@ public class WcWidth {
         UNASSIGNED(0, UNASSIGNED_TABLE),                        // The character is unassigned.
         WIDENED_IN_9(2, WIDENED_IN_9_TABLE);                    // Width is 1 in Unicode 8, 2 in Unicode 9+.
 
+        // The types in the order that of() checks them.
+        private static final Type[] CHECK_ORDER = {ONE, PRIVATE_USE, NON_PRINT, NON_CHARACTER, COMBINING, TWO, AMBIGUOUS, UNASSIGNED, WIDENED_IN_9};
+
         private final int defaultWidth;
         private final int[][][] tables;
 
@@ -80,10 +83,10 @@ public class WcWidth {
 
         public static Type of(int c) {
             if (c < 0 || c > 0x10FFFF) {
-                throw new IllegalArgumentException(format("'0x%X' is not a Unicode code point", c))
+                throw new IllegalArgumentException(format("'0x%X' is not a Unicode code point", c));
             }
 
-            return Stream.of(Type.values())
+            return Stream.of(CHECK_ORDER)
                     .filter(type -> type.contains(c))
                     .findFirst()
                     .orElse(ONE);
@@ -10,17 +10,69 @@
 #  The other hashes are simple `sha1sum` style hashes.
 #  )
 #
-#  generate.py:         b35da43f176cc0d5880c67356ebb064048c5bac4
-#  template.py:         60d5181aad5aa0388fa84e87ce6067101f866800
+#  generate.py:         4fd007b14cfdafa9061039befcf51ce643ad14bf
+#  template.py:         5d93e978dff085e90ed19abe1816c533fa1135cd
 #  UnicodeData.txt:     50dffef1b7d1f97b72e4c2adceb9b2245f0f34ba
 #  EastAsianWidth.txt:  2cadc5034b6206ad84b75898a1d4186bb38fc12b
 #  emoji-data.txt:      3d123e12f70f63e609c4281ce83dfdd9ac7443d2
 
-__all__ = ["wcwidth", "Special"]
+__all__ = [
+    "wcwidth",
+    "wcswidth",
+    "wcwidth_array",
+    "make_wcwidth",
+    "line_widths",
+    "truncate",
+    "ljust",
+    "rjust",
+    "center",
+    "wrap",
+    "slice_columns",
+    "format_table",
+    "WidthIndex",
+    "widths_parallel",
+    "async_line_widths",
+    "enable_stats",
+    "disable_stats",
+    "stats_snapshot",
+    "Special",
+    "DEFAULT_POLICY",
+]
 
-from typing import Union
+import binascii
+import codecs
+import collections
+import itertools
+import os
+import re
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from functools import lru_cache, wraps
+from time import perf_counter_ns
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from enum import Enum
 
+# Set WIDECHAR_WIDTH_PURE to use the pure Python code even if the C extension is built.
+_ext = None
+if not os.environ.get("WIDECHAR_WIDTH_PURE"):
+    try:
+        import _widechar_width as _ext
+    except ImportError:
+        pass
+
 # Special width values
 class Special(Enum):
     """The special values that wcwidth returns. Guaranteed to be negative.
@@ -44,42 +96,121 @@ class Special(Enum):
 
 
 class Codepointrange:
-    """A list of ranges of codepoints."""
+    """A set of codepoints, stored as sorted, disjoint inclusive ranges.
+
+    Supports `in`, iteration over (start, end) tuples, and the set operations
+    `|`, `&` and `-`, which work on the ranges without expanding them.
+    """
+
+    __slots__ = ("starts", "ends")
 
     def __init__(self, *ranges):
-        self.ranges = sorted(ranges)
+        self.starts = array("I")
+        self.ends = array("I")
+        # Merge overlapping and adjacent ranges, so that lookups only
+        # need to check the range with the closest start.
+        for start, end in sorted(ranges):
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    @classmethod
+    def _from_arrays(cls, starts, ends):
+        """Make a Codepointrange from arrays of sorted, disjoint ranges."""
+        result = cls.__new__(cls)
+        result.starts = starts
+        result.ends = ends
+        return result
+
+    @property
+    def ranges(self):
+        """The ranges as a list of (start, end) tuples."""
+        return list(zip(self.starts, self.ends))
 
     def __contains__(self, char):
-        left = 0
-        right = len(self.ranges) - 1
-        if not self.ranges[0][0] <= char <= self.ranges[right][1]:
-            return False
-
-        while right >= left:
-            middle = (left + right) // 2
-
-            if char < self.ranges[middle][0]:
-                right = middle - 1
-            elif char > self.ranges[middle][1]:
-                left = middle + 1
+        idx = bisect_right(self.starts, char) - 1
+        return idx >= 0 and char <= self.ends[idx]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __bool__(self):
+        return bool(self.starts)
+
+    def __eq__(self, other):
+        if not isinstance(other, Codepointrange):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self):
+        return "Codepointrange(%s)" % ", ".join(
+            "(0x%05X, 0x%05X)" % r for r in self
+        )
+
+    def union(self, other):
+        """Return the codepoints in either self or other."""
+        return Codepointrange(*self, *other)
+
+    def intersection(self, other):
+        """Return the codepoints in both self and other."""
+        starts, ends = array("I"), array("I")
+        idx, oidx = 0, 0
+        while idx < len(self.starts) and oidx < len(other.starts):
+            start = max(self.starts[idx], other.starts[oidx])
+            end = min(self.ends[idx], other.ends[oidx])
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+            # Advance whichever range ends first.
+            if self.ends[idx] < other.ends[oidx]:
+                idx += 1
             else:
-                return True
-        return False
+                oidx += 1
+        return Codepointrange._from_arrays(starts, ends)
+
+    def difference(self, other):
+        """Return the codepoints in self but not in other."""
+        starts, ends = array("I"), array("I")
+        oidx = 0
+        for start, end in self:
+            # Skip ranges of other that end before this range.
+            while oidx < len(other.starts) and other.ends[oidx] < start:
+                oidx += 1
+            # Cut out the ranges of other that overlap this range.
+            idx = oidx
+            while idx < len(other.starts) and other.starts[idx] <= end:
+                if other.starts[idx] > start:
+                    starts.append(start)
+                    ends.append(other.starts[idx] - 1)
+                start = other.ends[idx] + 1
+                idx += 1
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+        return Codepointrange._from_arrays(starts, ends)
 
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
 
-_TABLE = {
+
+# The ranges of each table as tuples,
+# or their offset and count in _PACKED_TABLES if the tables are packed.
+_TABLE_SOURCES = {
     # Simple ASCII characters - used a lot, so we check them first.
-    "ascii": Codepointrange(
+    "ascii": (
         (0x00020, 0x0007E),
     ),
     # Private usage range.
-    "private": Codepointrange(
+    "private": (
         (0x0E000, 0x0F8FF),
         (0xF0000, 0xFFFFD),
         (0x100000, 0x10FFFD),
     ),
     # Nonprinting characters.
-    "nonprint": Codepointrange(
+    "nonprint": (
         (0x00000, 0x0001F),
         (0x0007F, 0x0009F),
         (0x000AD, 0x000AD),
@@ -106,7 +237,7 @@ _TABLE = {
         (0xE0020, 0xE007F),
     ),
     # Width 0 combining marks.
-    "combining": Codepointrange(
+    "combining": (
         (0x00300, 0x0036F),
         (0x00483, 0x00489),
         (0x00591, 0x005BD),
@@ -436,12 +567,12 @@ _TABLE = {
         (0xE0100, 0xE01EF),
     ),
     # Width 0 combining letters.
-    "combiningletters": Codepointrange(
+    "combiningletters": (
         (0x01160, 0x011FF),
         (0x0D7B0, 0x0D7FF),
     ),
     # Width 2 characters.
-    "doublewide": Codepointrange(
+    "doublewide": (
         (0x01100, 0x0115F),
         (0x02329, 0x0232A),
         (0x02630, 0x02637),
@@ -518,7 +649,7 @@ _TABLE = {
         (0x30000, 0x3FFFD),
     ),
     # Ambiguous-width characters.
-    "ambiguous": Codepointrange(
+    "ambiguous": (
         (0x000A1, 0x000A1),
         (0x000A4, 0x000A4),
         (0x000A7, 0x000A8),
@@ -700,7 +831,7 @@ _TABLE = {
         (0x100000, 0x10FFFD),
     ),
     # Unassigned characters.
-    "unassigned": Codepointrange(
+    "unassigned": (
         (0x00378, 0x00379),
         (0x00380, 0x00383),
         (0x0038B, 0x0038B),
@@ -1459,7 +1590,7 @@ _TABLE = {
         (0xE01F0, 0xEFFFD),
     ),
     # Non-characters.
-    "nonchar": Codepointrange(
+    "nonchar": (
         (0x0FDD0, 0x0FDEF),
         (0x0FFFE, 0x0FFFF),
         (0x1FFFE, 0x1FFFF),
@@ -1480,7 +1611,7 @@ _TABLE = {
         (0x10FFFE, 0x10FFFF),
     ),
     # Characters that were widened from width 1 to 2 in Unicode 9.
-    "widened": Codepointrange(
+    "widened": (
         (0x0231A, 0x0231B),
         (0x023E9, 0x023EC),
         (0x023F0, 0x023F0),
@@ -1550,6 +1681,1343 @@ _TABLE = {
     ),
 }
 
+# How the tables are stored: "source", "packed" or "compressed".
+# Packed tables are hex, compressed tables are zlib-compressed and base64-encoded.
+# They hold little-endian 32 bit ints, alternating range start and end.
+_TABLE_FORMAT = "source"
+_PACKED_TABLES = None
+
+
+def _decompress(text):
+    """Decode a compressed table."""
+    return zlib.decompress(binascii.a2b_base64(text))
+
+
+@lru_cache(maxsize=None)
+def _unpacked_tables():
+    """Return _PACKED_TABLES as an array of ints. Only done on first use."""
+    if _TABLE_FORMAT == "compressed":
+        data = _decompress(_PACKED_TABLES)
+    else:
+        data = bytes.fromhex(_PACKED_TABLES)
+    result = array("I", data)
+    if sys.byteorder == "big":
+        result.byteswap()
+    return result
+
+
+class _Tables(dict):
+    """Maps table names to Codepointranges, each built on first use."""
+
+    def __missing__(self, name):
+        source = _TABLE_SOURCES[name]
+        if _PACKED_TABLES is not None:
+            offset, count = source
+            data = _unpacked_tables()[offset * 2 : (offset + count) * 2]
+            table = Codepointrange._from_arrays(data[::2], data[1::2])
+        else:
+            table = Codepointrange(*source)
+        self[name] = table
+        return table
+
+
+_TABLE = _Tables()
+
+
+# Two-stage lookup table, generated from the tables above.
+# _STAGE2 maps each codepoint to the index in _RESULTS of the first table
+# in _TABLE that contains it. Codepoints are grouped in blocks of
+# 2**7; _STAGE1 holds the offset of each block in _STAGE2,
+# in units of the block size, so that identical blocks are stored once.
+_STAGE1 = bytes.fromhex(
+    "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f"
+    "20212223242526272828282828292a2b2c2d2e2f303132333435283628283738"
+    "393a3b3c3d3e3f4041424344454647482828282828284928284a4b4c4d4e4f50"
+    "51525354554f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f562828575828595a5b5c5d5e5f60614f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f6263636363636363636363636363636363"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464644f4f4f4f6528282828666768696a"
+    "6b6c6d6e6f707172287374752828767778797a7b7c7d7e7f8081828384858687"
+    "88898a8b8c8d8e8f90916f929394956f969798999a9b9c9d9e9fa0a16fa2a3a4"
+    "28282828282828a5a628a76f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6fa8"
+    "2828282828282828a92828282828282828282828282828282828282828282828"
+    "282828282828286c28282828aa6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6fab6f6f6f6f6f6f6f6f6f6f6f6f6f28282828acadaeaf6f6fb06fb1b2b3b4"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4fb5b6b76f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6fb8"
+    "4f4fb94f4fba6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6fbbbc6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f28bd282828bebfa7"
+    "28c0c1c2c3c4c56fc6c7c82828c928ca28282828cbcc6f6f6f6f6f6f6f6fcd6f"
+    "cecfd06f6fd16f6f6fd26fd36fd46fd528d6d76f6f6f6f6fd8d9da6fdbdc6f6f"
+    "dddedfe0e16fe2e3e4e5e6e7e8e928eaebecedeeeff028f16f6f6f6f6f6f6ff2"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4ff3"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f"
+    "4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4f4ff3"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "f46ff5f66f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f"
+    "6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6f6ff2"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "64646464646464646464646464646464646464646464646464646464646464f7"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "6464646464646464646464646464646464646464646464646464646464646464"
+    "64646464646464646464646464646464646464646464646464646464646464f7"
+)
+_STAGE2 = bytes.fromhex(
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000002"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0a070a0a070a0a07070a070a0a02070a07070707070a07070707070a07070707"
+    "0a0a0a0a0a0a070a0a0a0a0a0a0a0a0a070a0a0a0a0a0a07070a0a0a0a0a0707"
+    "07070a0a0a0a070a0707070a07070a0a070a07070a0a0a070707070a070a070a"
+    "0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a070a070a0a0a0a0a0a0a070a0a0a0a"
+    "0a0a0a0a0a0a07070a0a0a070a0a0a0a0a0707070a0a0a0a070a0a0a0a0a0a07"
+    "0707070a070a0a0a070707070a070a0a0a0a07070a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a07070a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a070a070a070a070a070a070a070a070a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a070a0a070a0707070a070a0a070a0a0a0a0a0a0a070707070a070a07"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "040404040404040404040404040404040a0a0a0a0a0a0a0a08080a0a0a0a0a0a"
+    "080808080a0a0a0a0a0a0a080a080a0a0a070707070707070707070707070707"
+    "070708070707070707070a0a0a0a0a0a0a070707070707070707070707070707"
+    "07070a070707070707070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a07070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "070707070707070707070707070707070a070a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a08080a0a0a08040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040a04"
+    "0a04040a04040a0408080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0808080808080808080808"
+    "0202020202020a0a0a0a0a0a0a0a0a0a04040404040404040404040a020a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a040404040404040404040404040404040404040404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404020a04"
+    "04040404040a0a04040a040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a08020a040a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040404040404"
+    "040404040404040404040408080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a04040404040404040404040a0808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0404040404040404040a0a0a0a0a0a0a0808040a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040a0404040404"
+    "040404040a0404040a040404040408080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040408080a08"
+    "0a0a0a0a0a0a0a0a0a0a0a08080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a02020808080808040404040404040404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a04040404040404040404040404040404040404040404"
+    "0404020404040404040404040404040404040404040404040404040404040404"
+    "040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040a0404"
+    "040404040404040404040404040404040a040404040404040a0a0a0a0a0a0a0a"
+    "0a0a04040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a040404080a0a0a0a0a0a0a0a08080a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0808080a0a0a0a0808040a0404"
+    "04040404040808040408080404040a080808080808080804080808080a0a080a"
+    "0a0a040408080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0408"
+    "08040404080a0a0a0a0a0a080808080a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a080a0a080a0a080804080404"
+    "040404080808080404080804040408080804080808080808080a0a0a0a080a08"
+    "0808080808080a0a0a0a0a0a0a0a0a0a04040a0a0a040a080808080808080808"
+    "08040404080a0a0a0a0a0a0a0a0a080a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a080a0a0a0a0a0808040a0404"
+    "040404040404080404040804040408080a080808080808080808080808080808"
+    "0a0a040408080a0a0a0a0a0a0a0a0a0a0a0a080808080808080a040404040404"
+    "08040404080a0a0a0a0a0a0a0a08080a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a080a0a0a0a0a0808040a0404"
+    "040404040408080404080804040408080808080808040404080808080a0a080a"
+    "0a0a040408080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808"
+    "0808040a080a0a0a0a0a0a0808080a0a0a080a0a0a0a0808080a0a080a080a0a"
+    "0808080a0a0808080a0a0a0808080a0a0a0a0a0a0a0a0a0a0a0a080808080404"
+    "040404080808040404080404040408080a080808080808040808080808080808"
+    "0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808"
+    "04040404040a0a0a0a0a0a0a0a080a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808040a0404"
+    "0404040404080404040804040404080808080808080404080a0a0a080a0a0808"
+    "0a0a040408080a0a0a0a0a0a0a0a0a0a080808080808080a0a0a0a0a0a0a0a0a"
+    "0a0404040a0a0a0a0a0a0a0a0a080a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0808040a0404"
+    "040404040408040404080404040408080808080808040408080808080a0a0a08"
+    "0a0a040408080a0a0a0a0a0a0a0a0a0a080a0a04080808080808080808080808"
+    "040404040a0a0a0a0a0a0a0a0a080a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040a0404"
+    "04040404040804040408040404040a0a080808080a0a0a040a0a0a0a0a0a0a0a"
+    "0a0a040408080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "08040404080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a080a0808"
+    "0a0a0a0a0a0a0a08080804080808080404040404040804080404040404040404"
+    "0808080808080a0a0a0a0a0a0a0a0a0a080804040a0808080808080808080808"
+    "080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040a0a04040404040404080808080a"
+    "0a0a0a0a0a0a0a04040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080a0a080a080a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a080a080a0a0a0a0a0a0a0a0a0a040a0a0404040404040404040a0808"
+    "0a0a0a0a0a080a0804040404040404080a0a0a0a0a0a0a0a0a0a08080a0a0a0a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040a040a040a0a0a0a0404"
+    "0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a08080808040404040404040404040404040404"
+    "04040404040a04040a0a0a0a0a04040404040404040404040804040404040404"
+    "0404040404040404040404040404040404040404040404040404040404080a0a"
+    "0a0a0a0a0a0a040a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040404040404040404040a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040a0a0a0a0404"
+    "040a0404040a0a040404040404040a0a0a040404040a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0404040404040404040404040a040a0a0a0a0a0a0a0a0a0a040404040a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a080a08080808080a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a08080a0a0a0a0a0a0a080a080a0a0a0a0808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a08080a0a0a0a0a0a0a08"
+    "0a080a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a08080a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808040404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040808080808080808080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040a0a080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a080404080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040404040404"
+    "04040404040404040404040404040404040404040a0a0a0a0a0a0a0a0a040808"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a04040402040a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808"
+    "0a0a0a0a0a04040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a040a08080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0404040404040404040404040808080804040404040404040404040408080808"
+    "0a0808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a0a0808080a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040408080a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040404040404040408"
+    "0404040404040404040404040404040404040404040404040404040404080804"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a080804040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040808"
+    "0404040404040404040404040808080808080808080808080808080808080808"
+    "04040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040404040404"
+    "04040404040a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0404040404040404040a0a0a0a0a0a0a0a0a0a0a0a"
+    "0404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a040404040404040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a040404040404040404040404040408080808080808080a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a04040404040404040404040404040404040404040808080a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a08080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a"
+    "0a0a0a0a0a0a0a0a08080808080808080404040a040404040404040404040404"
+    "0404040404040404040a0a0a0a040a0a0a0a0a0a040a0a0404040a0808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a08080a0a0a0a0a0a08080a0a0a0a0a0a0a0a080a080a080a080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a080a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a080a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a0a0202020202070a0a070707070a07070a0a07070a0a"
+    "0707070a07070707020202020202020a070a07070a070a0a0a0a0a070a0a070a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "020202020208020202020202020202020a0a0808070a0a0a0a0a0a0a0a0a0a07"
+    "0a070707070a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a080808080808080808080808080804040404040404040404040404040404"
+    "0404040404040404040404040404040404080808080808080808080808080808"
+    "0a0a0a070a070a0a0a070a0a0a0a0a0a0a0a0a070a0a070a0a0a0a0a0a0a0a0a"
+    "0a07070a0a0a070a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a07070a0a0a0a0a0a070707070a"
+    "0707070707070707070707070a0a0a0a070707070707070707070a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a070a0a08080808070707070707070707070a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a07070a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a070a070a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "070a07070a0a0a07070a0a070a0a0a070a070a0a0a070a0a0a0a070a0a070707"
+    "070a0a070a070a0707070707070a070a0a0a0a0a070707070a0a0a0a07070a0a"
+    "0a0a0a0a0a0a0a0a070a0a0a070a0a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "07070a0a070707070a0a07070a0a07070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a07070a0a07070a0a0a0a0a0a0a0a0a0a0a0a0a070a0a0a070a0a0a0a0a0a"
+    "0a0a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a07"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a070a0a0a0a0a0a0a09090a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a06060a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a090909090a0a0a090a0a090a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a08080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080808080808080808"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "070707070707070707070a070707070707070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "0707070707070707070707070a0a0a0a07070707070707070707070707070707"
+    "07070707070707070707070707070707070707070a0a0a0a0a0a0a0a0a0a0a0a"
+    "070707070707070707070707070707070a0a070707070a0a0a0a0a0a0a0a0a0a"
+    "07070a070707070707070a0a0a0a0a0a0a0a07070a0a07070a0a0a0a07070a0a"
+    "07070a0a0a0a0707070a0a070a0a070707070a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a070707070a0a0a0a0a0a0a0a0a070a0a0a0a0a0a0a0a0a0a0a0a0a09090a"
+    "0a0a0a0a0a07070a0a070a0a0a0a07070a0a0a0a09090a0a0a0a0a0a070a070a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a06060606060606060a0a0a0a0a0a0a0a"
+    "070a070a0a0a0a0a0909090909090909090909090a0a0a0a0a0a0a0a0a0a0a0a"
+    "07070a0707070a070707070a07070a070a0a0a0a0a0a0a0a0a0a0a0a0a0a0a09"
+    "0a0a0a0a0a0a0a0a0a0a0606060606060a0a0a090a0a0a0a0a0a0a0a0a0a0707"
+    "0a090a0a0a0a0a0a0a0a09090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a090907"
+    "0a0a0a0a09090707070707070707090707070707090707070707070707070707"
+    "07070a070a0a0a0a070709070707070707070909070907070707090707090707"
+    "0a0a0a0a0a090a0a0a0a09090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a070a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a090a090a0a0a0a0909090a090a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a07070707070707070707"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0909090a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a090a0a0a0a0a0a0a0a0a0a0a0a0a0a09"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a09090a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a090a0a0a0a09070707070a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040a0a08080808080a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a080a08080808080a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a080808080808080a0a080808080808080808080808080804"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808"
+    "0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a0a0a0a0a0a08"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0606060606060606060606060606060606060606060606060606080606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606080808080808080808080808"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060608080808080808080808"
+    "0808080808080808080808080808080806060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "060606060606060606060404040404040606060606060606060606060606060a"
+    "0806060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606080804040606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0808080808060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060608060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060806060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060808080808080808080606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060608"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606070707070707070706060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060608080806060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "060606060606060808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040a040404040404040404040a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040a0a0a0a0a0a0808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "08080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a040a0a0a040a0a0a0a040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a04040404040a0a0a0a040808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808"
+    "04040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040404040404"
+    "04040404040408080808080808080a0a0a0a0a0a0a0a0a0a0a0a080808080808"
+    "0404040404040404040404040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a04"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a04040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0404040404040404040404040408080808080808080808080a"
+    "0606060606060606060606060606060606060606060606060606060606080808"
+    "040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040404"
+    "040a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a080808080a0a"
+    "0a0a0a0a0a040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0404040404040404040404040404080808080808080808"
+    "0a0a0a040a0a0a0a0a0a0a0a040408080a0a0a0a0a0a0a0a0a0a08080a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040a0404040a0a04040a0a0a0a0a0404"
+    "0a040a0808080808080808080808080808080808080808080808080a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a04040404040a0a0a0a0a0404080808080808080808"
+    "080a0a0a0a0a0a08080a0a0a0a0a0a08080a0a0a0a0a0a080808080808080808"
+    "0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a04040404040404040a040408080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060608080808080808080808080805050505050505050505050505050505"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0505050505050505050505050505050505050505050505050505050505050505"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0a0a0a0a0a0a0a0808080808080808080808080a0a0a0a0a08080808080a040a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a080a08"
+    "0a0a080a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a03030303030303030303030303030303"
+    "030303030303030303030303030303030a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0404040404040404040404040404040406060606060606060606080808080808"
+    "0404040404040404040404040404040406060606060606060606060606060606"
+    "0606060606060606060606060606060606060608060606060606060606060606"
+    "060606060606060806060606080808080a0a0a0a0a080a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080802"
+    "0806060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "060a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "08080a0a0a0a0a0a08080a0a0a0a0a0a08080a0a0a0a0a0a08080a0a0a080808"
+    "06060606060606080a0a0a0a0a0a0a080808080808080808080202020a070303"
+    "0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808"
+    "0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a08080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080808"
+    "040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a08080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a08080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a08080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a080a0a0a0a0a0a0a0a0a"
+    "0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808"
+    "0a0a0a0a0a0a0a0a080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a08080a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0808080a08080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "080808080808080a0a0a0a0a0a0a0a0a08080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a08080808080a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0404040804040808080808040404040a0a0a0a080a0a0a080a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080404040808080804"
+    "0a0a0a0a0a0a0a0a0a080808080808080a0a0a0a0a0a0a0a0a08080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0404080808080a0a0a0a0a0a0a0a0a0a0a0a080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080a0a0a0a080808"
+    "0808080808080808080a0a0a0a0a0a0a08080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0404040408080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a08080804040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a08080808080808080a0a08080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0804040a08080a0a0808080808080808080808080808"
+    "08080a0a0a0a0a0a08080808080808080a0a0a0a0a0a0a0a0a08080808080808"
+    "0808080808080808080808080808080808080808080808080808040404040404"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a08080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a04040404040404040404040a0a0a0a0a0a0a0a0a080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a040404040a0a0a0a08080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808"
+    "0404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040404040404"
+    "040404040404040a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040a0a04040a08080808080808080804"
+    "0404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040a0a020a0a"
+    "0a0a04080808080808080808080208080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0404040404040404040404040404080a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a04040a08080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040a0a0a080808080808080808"
+    "0404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040404"
+    "040a0a0a0a0a0a0a0a040404040a04040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0404040404040404040404040a0a0a0a0a0a040a"
+    "0a04080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a080a080a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04"
+    "040404040404040404040408080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "04040404080a0a0a0a0a0a0a0a08080a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a080a0a0a0a0a0804040a0404"
+    "040404040408080404080804040408080a0808080808080408080808080a0a0a"
+    "0a0a040408080404040404040408080804040404040808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a080a08080a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0404040404040404"
+    "04080408080408040404040804040404040a040a0a0a080a0a08080808080808"
+    "0804040808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040404040404040404"
+    "040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a040a"
+    "0a0a080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040404040404"
+    "040404040a0a0a0a08080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040404040408080404040404040404"
+    "040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040404040404040404040404040404"
+    "040a0a0a0a08080808080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a040404040404040404040404040a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a08080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808040404"
+    "040404040404040404040404080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a08080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0404040404040404040404040404040a08080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808080808080a"
+    "0a0a0a0a0a0a0a08080a08080a0a0a0a0a0a0a0a080a0a080a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040404040804040808040404040a"
+    "040a04040a0a0a0808080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040808040404040404"
+    "040a0a0a04080808080808080808080808080808080808080808080808080808"
+    "0a040404040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040a040404040a"
+    "0a0a0a0a0a0a0a0408080808080808080a04040404040404040404040a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a040404040404040404040404040404040a0a0a0a0a0a"
+    "0a0a0a080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808"
+    "0a0a0a0a0a0a0a0a0a0a08080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0404040404040404080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a08080808080808080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404040404040404080404040404040404"
+    "0a0a0a0a0a0a080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080404040404040404040404040404"
+    "0404040404040404080404040404040404040404040404080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a080a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404080808040804040804"
+    "0404040404040a0408080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a080a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a04040404040804040804040404040a08080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "0a0a0a0a0a0a0a0a0a0a08080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040a0a08080808080808"
+    "04040a040a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040808080404"
+    "0404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a08080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a02020202020202020202020202020202"
+    "040a0a0a0a0a0a04040404040404040404040404040408080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a08080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0404"
+    "040404040404040404040404040404040a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a080804040404040a08080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a040404040404040a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a080808080808080808080a0a0a0a0a0a0a0a0a0a080a0a0a0a0a"
+    "0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a08080808040a040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "040404040404040408080808080808040404040a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0606060604080808080808080808080804040606060606080808080808080808"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060608080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080806"
+    "0606060606060606060606060606060606060606060606060606060606060608"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060608080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080806060606080606060606060608060608"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060808080808080808080808080808080608080808080808080808080808"
+    "0808080808080808080808080808080806060608080608080808080808080808"
+    "0808080806060606080808080808080806060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060608080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a08080808080a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a0a0a0a0a0a0a0a0a080808080808080a0a0a0a0a0a0a0a0a0a08080a04040a"
+    "0202020208080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080808"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404080804040404040404040404040404040404"
+    "040404040404040808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a04040404040a0a0a04040404040402020202020202020404040404"
+    "0404040a0a040404040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a040404040a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0404040a0808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606080808080808080808"
+    "06060606060606060606060606060606060606060606060a0a08080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a"
+    "08080a08080a0a08080a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a080a080a0a0a"
+    "0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a080a0a0a0a08080a0a0a0a0a0a0a0a080a0a0a0a0a0a0a080a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a08"
+    "0a0a0a0a0a080a0808080a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "04040404040404040404040404040404040404040404040a0a0a0a0404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "040404040404040404040404040a0a0a0a0a0a0a0a040a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a040a0a0a0a0a0a0a0808080808080808080808080808080404040404"
+    "0804040404040404040404040404040408080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "08080808080a0a0a0a0a0a080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0404040404040408040404040404040404040404040404040408080404040404"
+    "040408040408040404040408080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808080808080808"
+    "0808080808080808080808080808080408080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a080808040404040404040a0a0a0a0a0a0a0808"
+    "0a0a0a0a0a0a0a0a0a0a080808080a0a08080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a040808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a040404040a0a0a0a0a0a0a0a0a0a08080808080a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a040404040a0a0a0a0a0a0a0a0a0a080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a04040a0a0a0a0a0a0a0a0a0a0a080808080a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a040a0a040a0a0a0a0a0a0a04040a0a0a0a0a0408080808080808080a0a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a080a0a0a0a080a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a08080a0a0a0a0a0a0a0a0a04040404040404080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a040404040404040a080808080a0a0a0a0a0a0a0a0a0a080808080a0a"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "08080808080808080808080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "080a0a080a08080a080a0a0a0a0a0a0a0a0a0a080a0a0a0a080a080a08080808"
+    "08080a080808080a080a080a080a0a0a080a0a080a08080a080a080a080a080a"
+    "080a0a080a08080a0a0a0a080a0a0a0a0a0a0a080a0a0a0a080a0a0a0a080a08"
+    "0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "080a0a0a080a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "080808080808080808080808080808080a0a0808080808080808080808080808"
+    "0a0a0a0a090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "080a0a0a0a0a0a0a0a0a0a0a0a0a0a09080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080808080808080808"
+    "07070707070707070707070a0a0a0a0a07070707070707070707070707070707"
+    "07070707070707070707070707070a0a07070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "070707070707070707070a0a0a0a0a0a07070707070707070707070707070707"
+    "0707070707070707070707070707090707090909090909090909090707070707"
+    "070707070707070707070707070a080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0609060808080808080808080808080806060606060606060606090606060606"
+    "0606060606060606060606060606060906060909090909060909090608080808"
+    "0606060606060606060808080808080809090808080808080808080808080808"
+    "0606060606060808080808080808080808080808080808080808080808080808"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "090a0a0a0a0a0a0a0a0a0a0a0a0909090909090909090a090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "09090909090909090909090909090909090909090909090909090909090a0909"
+    "09090909090909090909090909090909090909090a0a0a0a0a0a0a0a0a0a0a0a"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "09090909090909090909090a0a0a0a09090909090a0a0a0a0a0a0a0a0a0a0a0a"
+    "09090909090909090909090909090909090a0a0a090a0a0a0909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "090909090909090909090909090909090909090909090909090909090909090a"
+    "090a090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "09090909090909090909090909090909090909090909090909090909090a0a09"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a090909090a09090909090909090909090909090909"
+    "09090909090909090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a060a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a09090a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a060a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "090909090909090909090909090909090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090a0a0a0a0a0a090a0a0a0906060a0a0606060608080806060606"
+    "0a0a0a0a0a0a0a0a0a0a0a09090808080a0a0a0a060606060606060606080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080808080808"
+    "0606060606060606060606060808080806080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a08080808080808080a0a0a0a0a0a0a0a0a0a080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a08080808080808080a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a08080a0a0a0a0a0a0a0a0a0a0a0a08080808"
+    "0a0a08080808080808080808080808080a0a0a0a0a0a0a0a0a08080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0606060609090909090909090906060606060606"
+    "0606060606060606060606060606060606060606060606060606060a06060606"
+    "0606060606060a06060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0909090909060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0906060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a080806060606060606060606060606080808"
+    "0606060606060606060606080808060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060608060808080806060606060606060606060606060606080806"
+    "0606060606060606060606080808080606060606060606060608080808080808"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a080a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080303"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060606"
+    "0606060606060606060606060606060606060606060606060606060606060303"
+    "0802080808080808080808080808080808080808080808080808080808080808"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040408080808080808080808080808080808"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010303"
+)
+
+# SHA1 of _STAGE1 + _STAGE2, identifying these tables to the C extension.
+_STAGE_DIGEST = "d6af739cfea29fc90d3303de51f3e3b96ac91675"
+
+# The result for each table, in order of precedence:
+# ascii, private, nonprint, nonchar, combining, combiningletters,
+# doublewide, ambiguous, unassigned, widened, and none of the above.
+_RESULTS = (
+    1,
+    Special.private_use,
+    Special.nonprint,
+    Special.non_character,
+    Special.combining,
+    Special.combining,
+    2,
+    Special.ambiguous,
+    Special.unassigned,
+    Special.widened_in_9,
+    1,
+)
+
 
 # Return the width of character c, or a special negative value.
 def wcwidth(c: Union[str, int]) -> Union[int, Special]:
@@ -1565,24 +3033,836 @@ def wcwidth(c: Union[str, int]) -> Union[int, Special]:
     elif not 0 <= c <= 0x10FFFF:
         raise ValueError("Argument is out of Unicode range")
 
-    if c in _TABLE["ascii"]:
-        return 1
-    if c in _TABLE["private"]:
-        return Special.private_use
-    if c in _TABLE["nonprint"]:
-        return Special.nonprint
-    if c in _TABLE["nonchar"]:
-        return Special.non_character
-    if c in _TABLE["combining"]:
-        return Special.combining
-    if c in _TABLE["combiningletters"]:
-        return Special.combining
-    if c in _TABLE["doublewide"]:
-        return 2
-    if c in _TABLE["ambiguous"]:
-        return Special.ambiguous
-    if c in _TABLE["unassigned"]:
-        return Special.unassigned
-    if c in _TABLE["widened"]:
-        return Special.widened_in_9
-    return 1
+    return _RESULTS[
+        _STAGE2[(_STAGE1[c >> 7] << 7) | (c & 0x7f)]
+    ]
+
+
+# Widths for the special values, as recommended in the README.
+DEFAULT_POLICY = {
+    Special.nonprint: 0,
+    Special.combining: 0,
+    Special.ambiguous: 1,
+    Special.private_use: 1,
+    Special.unassigned: 0,
+    Special.widened_in_9: 2,
+    Special.non_character: 0,
+}
+
+
+def _policy_widths(policy):
+    """Return _RESULTS with the special values replaced by their width under policy.
+    Raises ValueError if policy has a key that is not a special value."""
+    widths = dict(DEFAULT_POLICY)
+    if policy is not None:
+        for key, width in policy.items():
+            try:
+                widths[Special(key)] = width
+            except ValueError:
+                raise ValueError("Not a special value: %r" % (key,)) from None
+    return tuple(
+        widths[result] if isinstance(result, Special) else result
+        for result in _RESULTS
+    )
+
+
+_DEFAULT_WIDTHS = _policy_widths(None)
+
+
+def make_wcwidth(
+    nonprint: int = 0,
+    combining: int = 0,
+    ambiguous: int = 1,
+    private_use: int = 1,
+    unassigned: int = 0,
+    widened_in_9: int = 2,
+    non_character: int = 0,
+) -> Callable[[Union[str, int]], int]:
+    """Returns a function like `wcwidth`, which returns the given width
+    instead of each special value, so it always returns an int.
+    The defaults are the same as `DEFAULT_POLICY`.
+
+    Functions are cached, so each policy is only built once.
+    """
+    return _make_wcwidth(
+        _policy_widths(
+            {
+                Special.nonprint: nonprint,
+                Special.combining: combining,
+                Special.ambiguous: ambiguous,
+                Special.private_use: private_use,
+                Special.unassigned: unassigned,
+                Special.widened_in_9: widened_in_9,
+                Special.non_character: non_character,
+            }
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_wcwidth(widths):
+    """make_wcwidth, with the policy given as widths from _policy_widths()."""
+
+    def policy_wcwidth(c: Union[str, int]) -> int:
+        """Given a Unicode codepoint as a string or int,
+        returns the number of cells it should occupy in fixed-cell rendering like in a terminal.
+        """
+        if isinstance(c, str):
+            try:
+                c = ord(c)
+            except Exception:
+                raise ValueError("Argument must be a codepoint as a string or int")
+        elif not 0 <= c <= 0x10FFFF:
+            raise ValueError("Argument is out of Unicode range")
+        return widths[_STAGE2[(_STAGE1[c >> 7] << 7) | (c & 0x7f)]]
+
+    return policy_wcwidth
+
+
+# Printable ASCII, which always has width 1.
+_ASCII_RUN = re.compile("[\x20-\x7e]+")
+
+
+def wcswidth(s: str, policy: Optional[Mapping[Special, int]] = None) -> int:
+    """Given a string, returns the number of cells it should occupy in
+    fixed-cell rendering like in a terminal.
+
+    The special values from `wcwidth` are converted to widths using `policy`,
+    a mapping from `Special` members, or their negative int values, to widths.
+    Members missing from it fall back to `DEFAULT_POLICY`.
+    Any other key raises ValueError.
+    """
+    return _wcswidth(s, _DEFAULT_WIDTHS if policy is None else _policy_widths(policy))
+
+
+@lru_cache(maxsize=None)
+def _special_widths(widths):
+    """Given widths from _policy_widths(),
+    return the widths for the special values -1 down to -7, for the C extension."""
+    result = [0] * len(Special)
+    for value, width in zip(_RESULTS, widths):
+        if isinstance(value, Special):
+            result[-value.value - 1] = width
+    return tuple(result)
+
+
+def _wcswidth(s, widths):
+    """wcswidth, with the policy given as widths from _policy_widths()."""
+    if s.isascii() and s.isprintable():
+        return len(s)
+    if _ext is not None:
+        return _ext.wcswidth(s, _special_widths(widths))
+
+    # Count runs of printable ASCII at once, then look up the rest.
+    rest = _ASCII_RUN.sub("", s)
+    stage1, stage2 = _STAGE1, _STAGE2
+    return (len(s) - len(rest)) + sum(
+        [
+            widths[stage2[(stage1[c >> 7] << 7) | (c & 0x7f)]]
+            for c in map(ord, rest)
+        ]
+    )
+
+
+def _advance(text, col, maxcol, tabsize, widths):
+    """Advance the column position over text, which contains no newlines.
+    Return the new position, and the largest position before a carriage return."""
+    for idx, segment in enumerate(text.split("\r")):
+        if idx:
+            maxcol = max(maxcol, col)
+            col = 0
+        if "\t" in segment:
+            for tab_idx, piece in enumerate(segment.split("\t")):
+                if tab_idx and tabsize > 0:
+                    col = (col // tabsize + 1) * tabsize
+                col += _wcswidth(piece, widths)
+        else:
+            col += _wcswidth(segment, widths)
+    return col, maxcol
+
+
+def line_widths(
+    stream,
+    tabsize: int = 8,
+    policy: Optional[Mapping[Special, int]] = None,
+    errors: str = "replace",
+    chunk_size: int = 1 << 16,
+) -> Iterator[int]:
+    """Given a binary file object or an iterable of bytes chunks,
+    decodes it as UTF-8 and yields the display width of each line.
+
+    Tabs advance to the next multiple of `tabsize`, or add no width if `tabsize`
+    is 0 or less, like `str.expandtabs`. A carriage return moves back
+    to the start of the line, and the line is as wide as the furthest column reached.
+    A final line without a newline is included if it is not empty.
+    `policy` is as for `wcswidth`, and `errors` is passed to the decoder.
+
+    Input is read `chunk_size` bytes at a time and is never held in memory at once,
+    even if it contains very long lines.
+    """
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    chunks = stream
+    if hasattr(stream, "read"):
+        chunks = iter(lambda: stream.read(chunk_size), b"")
+    decoder = codecs.getincrementaldecoder("utf-8")(errors)
+
+    # pending is whether the current line has any characters yet.
+    col, maxcol, pending = 0, 0, False
+    for chunk in itertools.chain(chunks, [None]):
+        text = decoder.decode(b"" if chunk is None else chunk, chunk is None)
+        lines = text.split("\n")
+        for line in lines[:-1]:
+            col, maxcol = _advance(line, col, maxcol, tabsize, widths)
+            yield max(col, maxcol)
+            col, maxcol, pending = 0, 0, False
+        col, maxcol = _advance(lines[-1], col, maxcol, tabsize, widths)
+        pending = pending or bool(lines[-1])
+    if pending:
+        yield max(col, maxcol)
+
+
+def _char_widths(s, widths):
+    """Return a list of the width of each character in s."""
+    stage1, stage2 = _STAGE1, _STAGE2
+    return [
+        widths[stage2[(stage1[c >> 7] << 7) | (c & 0x7f)]]
+        for c in map(ord, s)
+    ]
+
+
+def _end_columns(s, widths):
+    """Return a list of the column at which each character in s ends.
+    Zero-width characters end where the character before them ends,
+    so a bisect never separates them from it."""
+    return list(itertools.accumulate(_char_widths(s, widths)))
+
+
+def _is_simple(s):
+    """Whether every character in s is printable ASCII, and so has width 1."""
+    return s.isascii() and s.isprintable()
+
+
+def truncate(
+    s: str,
+    cols: int,
+    ellipsis: str = "…",
+    policy: Optional[Mapping[Special, int]] = None,
+) -> str:
+    """Returns s if it fits in `cols` columns. Otherwise, returns the longest prefix
+    of s that fits along with `ellipsis`, followed by `ellipsis`.
+    If `ellipsis` itself does not fit, it is left out.
+    `policy` is as for `wcswidth`.
+    """
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    limit = cols - _wcswidth(ellipsis, widths)
+    if limit < 0:
+        ellipsis, limit = "", cols
+    if _is_simple(s):
+        return s if len(s) <= cols else s[: max(limit, 0)] + ellipsis
+    ends = _end_columns(s, widths)
+    if not ends or ends[-1] <= cols:
+        return s
+    return s[: bisect_right(ends, limit)] + ellipsis
+
+
+def ljust(
+    s: str, cols: int, fillchar: str = " ", policy: Optional[Mapping[Special, int]] = None
+) -> str:
+    """Pads s on the right with `fillchar` to a width of `cols` columns.
+    s is returned unchanged if it is already as wide.
+    `fillchar` should have width 1. `policy` is as for `wcswidth`."""
+    return s + fillchar * (cols - wcswidth(s, policy))
+
+
+def rjust(
+    s: str, cols: int, fillchar: str = " ", policy: Optional[Mapping[Special, int]] = None
+) -> str:
+    """Like `ljust`, but pads s on the left."""
+    return fillchar * (cols - wcswidth(s, policy)) + s
+
+
+def center(
+    s: str, cols: int, fillchar: str = " ", policy: Optional[Mapping[Special, int]] = None
+) -> str:
+    """Like `ljust`, but pads s on both sides. Odd padding puts the extra column on the right."""
+    pad = max(cols - wcswidth(s, policy), 0)
+    return fillchar * (pad // 2) + s + fillchar * (pad - pad // 2)
+
+
+def _strip_end(text, start, end, char_widths):
+    """Return where text[start:end] ends without its trailing spaces,
+    and the zero-width characters that follow them."""
+    stop = end
+    while stop > start and (text[stop - 1] == " " or not char_widths[stop - 1]):
+        stop -= 1
+    # Keep the zero-width characters that belong to the last character kept.
+    while stop < end and text[stop] != " ":
+        stop += 1
+    return stop
+
+
+def wrap(
+    s: str, cols: int, policy: Optional[Mapping[Special, int]] = None
+) -> List[str]:
+    """Wraps s into lines of at most `cols` columns, and returns the list of lines.
+
+    Lines are broken at spaces where possible, and the spaces at a break are dropped.
+    Words wider than `cols` are broken between characters.
+    Newlines in s always start a new line.
+    A character wider than `cols` gets a line to itself.
+    `policy` is as for `wcswidth`.
+    """
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    lines = []
+    for text in s.split("\n"):
+        char_widths = _char_widths(text, widths)
+        start = 0  # index where the current line starts
+        col = 0  # width of the current line
+        brk = None  # index of the last space in the current line
+        brk_col = 0  # width of the current line up to that space
+        idx = 0
+        while idx < len(text):
+            width = char_widths[idx]
+            if text[idx] == " ":
+                brk, brk_col = idx, col
+            elif col + width > cols and width and idx > start:
+                if brk is not None:
+                    # Break at the last space, and carry the rest over.
+                    lines.append(text[start : _strip_end(text, start, brk, char_widths)])
+                    start = brk + 1
+                    col -= brk_col + char_widths[brk]
+                else:
+                    lines.append(text[start:idx])
+                    start, col = idx, 0
+                brk = None
+                # Spaces at the start of a line are dropped,
+                # along with any zero-width characters after them.
+                while start < idx and (text[start] == " " or not char_widths[start]):
+                    col -= char_widths[start]
+                    start += 1
+                continue
+            col += width
+            idx += 1
+        lines.append(text[start : _strip_end(text, start, len(text), char_widths)])
+    return lines
+
+
+def slice_columns(
+    s: str,
+    start: int,
+    end: Optional[int] = None,
+    policy: Optional[Mapping[Special, int]] = None,
+) -> str:
+    """Returns the part of s that is displayed in columns `start` up to `end`.
+    If `end` is None, continues to the end of s.
+
+    Wide characters that straddle `start` or `end` are replaced by spaces
+    for the columns that are inside the slice, so the result lines up with s.
+    Zero-width characters stay with the character before them.
+    Negative columns are treated as 0. `policy` is as for `wcswidth`.
+    """
+    start = max(start, 0)
+    if end is not None:
+        end = max(end, 0)
+    if _is_simple(s):
+        return s[start:end]
+    if end is not None and end <= start:
+        return ""
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    ends = _end_columns(s, widths)
+    if end is None:
+        end = ends[-1] if ends else 0
+
+    # The first character that ends after start.
+    begin = bisect_right(ends, start)
+    prefix = ""
+    if begin < len(ends) and (ends[begin - 1] if begin else 0) < start:
+        # It starts before start, so replace it and its combining marks.
+        prefix = " " * (min(ends[begin], end) - start)
+        begin = bisect_right(ends, ends[begin])
+
+    # The first character that ends after end.
+    stop = max(bisect_right(ends, end), begin)
+    suffix = ""
+    if stop < len(ends):
+        # It may start before end, so pad the columns it would have covered.
+        suffix = " " * (end - max(ends[stop - 1] if stop else 0, start))
+    return prefix + s[begin:stop] + suffix
+
+
+def format_table(
+    rows: Iterable[Sequence[str]],
+    max_widths: Optional[Sequence[Optional[int]]] = None,
+    align: Optional[Sequence[str]] = None,
+    sep: str = "  ",
+    ellipsis: str = "…",
+    policy: Optional[Mapping[Special, int]] = None,
+) -> List[str]:
+    """Lays out rows of single-line cells in columns, and returns the list of lines.
+
+    Each column is as wide as its widest cell, but no wider than its entry in
+    `max_widths`, if that is not None. Wider cells are truncated with `ellipsis`.
+    `align` holds "<", ">" or "^" for each column to align it left, right or
+    centered; columns are left-aligned by default. Columns are joined with `sep`,
+    and the last column is not padded if it is left-aligned.
+    Rows may have fewer cells than others. `policy` is as for `wcswidth`.
+
+    Each cell is measured once; the widths are kept for padding.
+    """
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    rows = [list(row) for row in rows]
+    cell_widths = [[_wcswidth(cell, widths) for cell in row] for row in rows]
+    columns = max(map(len, rows), default=0)
+    column_widths = [0] * columns
+    for row in cell_widths:
+        for idx, width in enumerate(row):
+            if width > column_widths[idx]:
+                column_widths[idx] = width
+    for idx, limit in enumerate(max_widths or ()):
+        if limit is not None and idx < columns:
+            column_widths[idx] = min(column_widths[idx], limit)
+    align = list(align or ()) + ["<"] * (columns - len(align or ()))
+
+    lines = []
+    for row, row_widths in zip(rows, cell_widths):
+        row = row + [""] * (columns - len(row))
+        row_widths = row_widths + [0] * (columns - len(row_widths))
+        cells = []
+        for idx, (cell, width) in enumerate(zip(row, row_widths)):
+            column_width = column_widths[idx]
+            if width > column_width:
+                cell = truncate(cell, column_width, ellipsis, policy)
+                width = _wcswidth(cell, widths)
+            pad = column_width - width
+            if align[idx] == ">":
+                cell = " " * pad + cell
+            elif align[idx] == "^":
+                cell = " " * (pad // 2) + cell + " " * (pad - pad // 2)
+            elif idx < columns - 1:
+                cell = cell + " " * pad
+            cells.append(cell)
+        lines.append(sep.join(cells))
+    return lines
+
+
+def _fenwick(values):
+    """Return a Fenwick tree over values, as a list."""
+    tree = [0] + list(values)
+    for idx in range(1, len(tree)):
+        parent = idx + (idx & -idx)
+        if parent < len(tree):
+            tree[parent] += tree[idx]
+    return tree
+
+
+def _fenwick_add(tree, idx, delta):
+    """Add delta to value idx of a Fenwick tree."""
+    idx += 1
+    while idx < len(tree):
+        tree[idx] += delta
+        idx += idx & -idx
+
+
+def _fenwick_sum(tree, count):
+    """Return the sum of the first count values of a Fenwick tree."""
+    total = 0
+    while count > 0:
+        total += tree[count]
+        count -= count & -count
+    return total
+
+
+def _fenwick_search(tree, target):
+    """Return the largest count such that the sum of the first count values
+    of a Fenwick tree of non-negative values is at most target, and that sum."""
+    pos, total = 0, 0
+    step = 1 << (len(tree) - 1).bit_length()
+    while step:
+        if pos + step < len(tree) and total + tree[pos + step] <= target:
+            pos += step
+            total += tree[pos]
+        step >>= 1
+    return pos, total
+
+
+class WidthIndex:
+    """The display widths of a line of text, maintained as the text is edited,
+    for mapping between character offsets and columns.
+
+    The text is kept in chunks of a bounded number of characters, with Fenwick
+    trees over the length and width of each chunk. Lookups and small edits
+    take O(log n) time plus a scan of one chunk, instead of measuring the whole line.
+    Edits that split, empty or span chunks measure only the chunks they re-split,
+    and rebuild the trees from the stored chunk sizes in O(n / CHUNK_SIZE).
+    Character widths are as for `wcswidth`, and must be non-negative under `policy`.
+    """
+
+    __slots__ = ("_widths", "_chunks", "_chunk_lengths", "_chunk_widths", "_lengths", "_columns")
+
+    # Text is split into chunks of this many characters. Edits change a chunk
+    # in place until it grows past twice this, and only then split it again.
+    CHUNK_SIZE = 128
+
+    def __init__(self, text: str = "", policy: Optional[Mapping[Special, int]] = None):
+        self._widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+        if min(self._widths) < 0:
+            raise ValueError("Policy widths must not be negative")
+        self._chunks = []
+        self._chunk_lengths = []
+        self._chunk_widths = []
+        self._set_chunks(0, 0, text)
+
+    def _set_chunks(self, first, last, text):
+        """Replace chunks first up to last with text, split into chunks of
+        CHUNK_SIZE characters, and rebuild the trees. Only text is measured."""
+        size = self.CHUNK_SIZE
+        chunks = [text[idx : idx + size] for idx in range(0, len(text), size)]
+        self._chunks[first:last] = chunks
+        self._chunk_lengths[first:last] = map(len, chunks)
+        self._chunk_widths[first:last] = [_wcswidth(chunk, self._widths) for chunk in chunks]
+        self._lengths = _fenwick(self._chunk_lengths)
+        self._columns = _fenwick(self._chunk_widths)
+
+    def _find_offset(self, offset):
+        """Return the index of the chunk containing offset, and the offset it starts at.
+        An offset at the end of the text is in the last chunk."""
+        if not 0 <= offset <= len(self):
+            raise IndexError("Offset out of range")
+        idx, start = _fenwick_search(self._lengths, offset)
+        if idx == len(self._chunks) and idx:
+            idx -= 1
+            start -= self._chunk_lengths[idx]
+        return idx, start
+
+    def __len__(self):
+        return _fenwick_sum(self._lengths, len(self._chunks))
+
+    def __str__(self):
+        return "".join(self._chunks)
+
+    @property
+    def width(self) -> int:
+        """The width of the whole text."""
+        return _fenwick_sum(self._columns, len(self._chunks))
+
+    def column_of(self, offset: int) -> int:
+        """Returns the column at which the character at offset starts.
+        The offset may be the length of the text, to get its width."""
+        idx, start = self._find_offset(offset)
+        if idx == len(self._chunks):
+            return 0
+        head = self._chunks[idx][: offset - start]
+        return _fenwick_sum(self._columns, idx) + _wcswidth(head, self._widths)
+
+    def offset_of(self, column: int) -> int:
+        """Returns the offset of the character that covers column.
+        Zero-width characters never cover a column, so the result is the offset
+        of the character they follow. Columns past the end give the length of the text."""
+        idx, start_column = _fenwick_search(self._columns, max(column, 0))
+        if idx == len(self._chunks):
+            return len(self)
+        ends = _end_columns(self._chunks[idx], self._widths)
+        local = bisect_right(ends, column - start_column)
+        return _fenwick_sum(self._lengths, idx) + local
+
+    def replace(self, start: int, end: int, text: str):
+        """Replaces the characters from start up to end with text."""
+        if not 0 <= start <= end <= len(self):
+            raise IndexError("Offset out of range")
+        first, first_start = self._find_offset(start)
+        last, _ = self._find_offset(end - 1 if end > start else end)
+        if first == len(self._chunks):
+            self._set_chunks(0, 0, text)
+            return
+        joined = "".join(self._chunks[first : last + 1])
+        joined = joined[: start - first_start] + text + joined[end - first_start :]
+        if first == last and 0 < len(joined) <= 2 * self.CHUNK_SIZE:
+            # The common case: update one chunk in place.
+            width = _wcswidth(joined, self._widths)
+            _fenwick_add(self._lengths, first, len(joined) - self._chunk_lengths[first])
+            _fenwick_add(self._columns, first, width - self._chunk_widths[first])
+            self._chunks[first] = joined
+            self._chunk_lengths[first] = len(joined)
+            self._chunk_widths[first] = width
+        else:
+            self._set_chunks(first, last + 1, joined)
+
+    def insert(self, offset: int, text: str):
+        """Inserts text at offset."""
+        self.replace(offset, offset, text)
+
+    def delete(self, start: int, end: int):
+        """Deletes the characters from start up to end."""
+        self.replace(start, end, "")
+
+
+def _lines_widths(lines, tabsize, widths):
+    """Return the width of each line, as for `line_widths`. May run in an executor."""
+    result = []
+    for line in lines:
+        col, maxcol = _advance(line, 0, 0, tabsize, widths)
+        result.append(max(col, maxcol))
+    return result
+
+
+async def async_line_widths(
+    reader,
+    tabsize: int = 8,
+    policy: Optional[Mapping[Special, int]] = None,
+    errors: str = "replace",
+    chunk_size: int = 1 << 16,
+    executor=None,
+    inline_limit: int = 4096,
+) -> AsyncIterator[Tuple[str, int]]:
+    """Given an `asyncio.StreamReader`, decodes it as UTF-8 and yields
+    a tuple (line, width) for each line, without the newline.
+
+    Widths are as for `line_widths`, and so are `tabsize`, `policy` and `errors`.
+    Each read of up to `chunk_size` bytes is measured as one batch. Batches of more
+    than `inline_limit` characters are measured in `executor` (default: the event
+    loop's default executor), so that large inputs do not block the event loop.
+    """
+    import asyncio
+
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    loop = asyncio.get_running_loop()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors)
+    partial = []  # pieces of the current line
+    while True:
+        chunk = await reader.read(chunk_size)
+        lines = decoder.decode(chunk, not chunk).split("\n")
+        if len(lines) > 1:
+            partial.append(lines[0])
+            lines[0] = "".join(partial)
+            partial = [lines.pop()]
+        else:
+            partial.append(lines.pop())
+        if not chunk:
+            last = "".join(partial)
+            if last:
+                lines.append(last)
+        if lines:
+            if sum(map(len, lines)) > inline_limit:
+                batch = await loop.run_in_executor(
+                    executor, _lines_widths, lines, tabsize, widths
+                )
+            else:
+                batch = _lines_widths(lines, tabsize, widths)
+            for item in zip(lines, batch):
+                yield item
+        if not chunk:
+            return
+
+
+def _widths_chunk(strings, widths):
+    """Return the widths of a list of strings. Runs in worker processes."""
+    return [_wcswidth(s, widths) for s in strings]
+
+
+def widths_parallel(
+    strings: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 4096,
+    policy: Optional[Mapping[Special, int]] = None,
+) -> Iterator[int]:
+    """Yields the `wcswidth` of each string, in order,
+    computing them in a pool of `workers` processes (default: one per CPU).
+
+    Strings are sent to the workers in lists of `chunksize`, and only a few chunks
+    per worker are in flight at once, so `strings` may be a long-running iterator.
+    Each worker imports this module, and so builds its tables, once.
+    With `workers=1` the widths are computed in this process.
+    `policy` is as for `wcswidth`.
+    """
+    widths = _DEFAULT_WIDTHS if policy is None else _policy_widths(policy)
+    strings = iter(strings)
+    chunks = iter(lambda: list(itertools.islice(strings, chunksize)), [])
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield from _widths_chunk(chunk, widths)
+        return
+
+    # Imported here, as it is slow to import and rarely needed.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        max_pending = 2 * workers
+        for chunk in chunks:
+            pending.append(executor.submit(_widths_chunk, chunk, widths))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+_numpy_tables = None
+
+
+def _get_numpy_tables():
+    """Return (numpy, stage1, stage2, results) as numpy arrays,
+    or None if numpy is not available. numpy is only imported on first use."""
+    global _numpy_tables
+    if _numpy_tables is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_tables = ()
+        else:
+            _numpy_tables = (
+                numpy,
+                numpy.frombuffer(_STAGE1, dtype=numpy.uint8).astype(numpy.uint32),
+                numpy.frombuffer(_STAGE2, dtype=numpy.uint8),
+                numpy.array(
+                    [r.value if isinstance(r, Special) else r for r in _RESULTS],
+                    dtype=numpy.int8,
+                ),
+            )
+    return _numpy_tables or None
+
+
+def wcwidth_array(codepoints):
+    """Given a sequence of codepoints as ints, like a numpy uint32 array,
+    returns the `wcwidth` of each as an int8 array.
+    Special values are returned as their negative int value.
+
+    If numpy is installed, this is a single vectorized lookup and returns a numpy array.
+    Otherwise it falls back to pure Python and returns an `array.array` of type "b".
+    """
+    tables = _get_numpy_tables()
+    if tables is None:
+        try:
+            cps = array("I", codepoints)
+        except OverflowError:
+            raise ValueError("Argument is out of Unicode range")
+        if cps and max(cps) > 0x10FFFF:
+            raise ValueError("Argument is out of Unicode range")
+        if _ext is not None:
+            result = array("b", bytes(len(cps)))
+            _ext.classify(cps, result)
+            return result
+        results = [r.value if isinstance(r, Special) else r for r in _RESULTS]
+        stage1, stage2 = _STAGE1, _STAGE2
+        return array(
+            "b",
+            [
+                results[stage2[(stage1[c >> 7] << 7) | (c & 0x7f)]]
+                for c in cps
+            ],
+        )
+
+    numpy, stage1, stage2, results = tables
+    cps = numpy.asarray(codepoints)
+    if cps.size and (cps.min() < 0 or cps.max() > 0x10FFFF):
+        raise ValueError("Argument is out of Unicode range")
+    cps = cps.astype(numpy.uint32, copy=False)
+    return results[stage2[(stage1[cps >> 7] << 7) | (cps & 0x7f)]]
+
+
+# The names of the tables in the order of _RESULTS, for stats_snapshot.
+_STATS_TABLES = (
+    "ascii",
+    "private",
+    "nonprint",
+    "nonchar",
+    "combining",
+    "combiningletters",
+    "doublewide",
+    "ambiguous",
+    "unassigned",
+    "widened",
+    "default",
+)
+_LATENCY_BUCKETS = 32
+
+# While enable_stats is in effect, the wcwidth it replaced. Otherwise None.
+_stats_wcwidth = None
+# The lookups counted per table, and per latency bucket or None.
+_stats_hits = [0] * len(_STATS_TABLES)
+_stats_latency = None
+
+
+def enable_stats(latency: bool = False) -> None:
+    """Starts counting the lookups made through `widechar_width.wcwidth`, from zero.
+
+    Each lookup is counted against the table that resolved it, and with
+    latency=True the time it took is recorded too. `stats_snapshot` returns
+    the counts. This replaces the module's `wcwidth` with a counting version
+    until `disable_stats` is called, so lookups cost nothing extra while it is
+    off, and references taken with `from widechar_width import wcwidth`
+    are not counted.
+    """
+    global wcwidth, _stats_wcwidth, _stats_hits, _stats_latency
+    disable_stats()
+    lookup = _stats_wcwidth = wcwidth
+    hits = _stats_hits = [0] * len(_STATS_TABLES)
+    histogram = _stats_latency = [0] * _LATENCY_BUCKETS if latency else None
+
+    @wraps(lookup)
+    def counting_wcwidth(c):
+        result = lookup(c)
+        if isinstance(c, str):
+            c = ord(c)
+        hits[_STAGE2[(_STAGE1[c >> 7] << 7) | (c & 0x7f)]] += 1
+        return result
+
+    @wraps(lookup)
+    def timed_wcwidth(c):
+        start = perf_counter_ns()
+        result = lookup(c)
+        elapsed = perf_counter_ns() - start
+        histogram[min(elapsed.bit_length(), _LATENCY_BUCKETS - 1)] += 1
+        if isinstance(c, str):
+            c = ord(c)
+        hits[_STAGE2[(_STAGE1[c >> 7] << 7) | (c & 0x7f)]] += 1
+        return result
+
+    wcwidth = timed_wcwidth if latency else counting_wcwidth
+
+
+def disable_stats() -> None:
+    """Stops counting lookups and restores the uninstrumented `wcwidth`.
+    The counts are kept for `stats_snapshot`."""
+    global wcwidth, _stats_wcwidth
+    if _stats_wcwidth is not None:
+        wcwidth = _stats_wcwidth
+        _stats_wcwidth = None
+
+
+def stats_snapshot() -> dict:
+    """Returns the lookups counted since `enable_stats` was last called, as a dict with:
+
+    "lookups": the number of lookups.
+    "tables": the lookups resolved by each table, by name, with "default" for
+      characters in none of the tables.
+    "probes": the lookups by the number of tables the range-based ports probe
+      to resolve them, checking the tables in the order of "tables".
+    "latency_ns": None without latency=True, or the lookups by duration,
+      keyed by a power of two that each duration is below.
+    """
+    probes = collections.Counter()
+    for idx, count in enumerate(_stats_hits):
+        if count:
+            probes[min(idx + 1, len(_STATS_TABLES) - 1)] += count
+    latency = None
+    if _stats_latency is not None:
+        latency = {1 << idx: count for idx, count in enumerate(_stats_latency) if count}
+    return {
+        "lookups": sum(_stats_hits),
+        "tables": dict(zip(_STATS_TABLES, _stats_hits)),
+        "probes": dict(sorted(probes.items())),
+        "latency_ns": latency,
+    }
+
+
+# Use the C extension built from widechar_width_ext.c, if it was generated
+# alongside this module from the same data. Its wcwidth replaces the pure
+# Python one, and the other functions call into it where they can.
+_EXT_GENERATED_BY = "17.0.0 4fd007b14cfdafa9061039befcf51ce643ad14bf " + _STAGE_DIGEST
+if _ext is not None and getattr(_ext, "GENERATED_BY", None) == _EXT_GENERATED_BY:
+    _ext.set_specials(tuple(Special))
+    _py_wcwidth = wcwidth
+    wcwidth = _ext.wcwidth
+else:
+    _ext = None
@@ -11,8 +11,8 @@
  *  The other hashes are simple `sha1sum` style hashes.
  *  )
  *
- *  generate.py:         b35da43f176cc0d5880c67356ebb064048c5bac4
- *  template.js:         c455e7c973da323c43c98d6975fb8b024bf118f1
+ *  generate.py:         4fd007b14cfdafa9061039befcf51ce643ad14bf
+ *  template.js:         4e5e4b50d892d10817c461c0d60c6cb96fadfdaa
  *  UnicodeData.txt:     50dffef1b7d1f97b72e4c2adceb9b2245f0f34ba
  *  EastAsianWidth.txt:  2cadc5034b6206ad84b75898a1d4186bb38fc12b
  *  emoji-data.txt:      3d123e12f70f63e609c4281ce83dfdd9ac7443d2
@@ -11,8 +11,8 @@
  *  The other hashes are simple `sha1sum` style hashes.
  *  )
  *
- *  generate.py:         b35da43f176cc0d5880c67356ebb064048c5bac4
- *  template.js:         1985fb56796d6d9627f9c5290d5dee9f9364bcf4
+ *  generate.py:         4fd007b14cfdafa9061039befcf51ce643ad14bf
+ *  template.js:         517d38055c4c89e175b5066e12e640d7eeed93c7
  *  UnicodeData.txt:     50dffef1b7d1f97b72e4c2adceb9b2245f0f34ba
  *  EastAsianWidth.txt:  2cadc5034b6206ad84b75898a1d4186bb38fc12b
  *  emoji-data.txt:      3d123e12f70f63e609c4281ce83dfdd9ac7443d2
@@ -1562,29 +1562,140 @@ static inline bool widechar_in_table(const struct widechar_range* arr, size_t le
 
 
 
+/*
+ * Lookup statistics. Define WIDECHAR_WIDTH_STATS, for example with
+ * -DWIDECHAR_WIDTH_STATS, to count which table resolved each lookup and how
+ * many tables were probed. Define WIDECHAR_WIDTH_STATS_LATENCY as well to
+ * collect a histogram of lookup times, which uses C11 timespec_get. Without
+ * them the counting compiles to nothing. The counters are not thread safe.
+ */
+#if defined(WIDECHAR_WIDTH_STATS_LATENCY) && !defined(WIDECHAR_WIDTH_STATS)
+#define WIDECHAR_WIDTH_STATS
+#endif
+
+/* The tables wcwidth checks, then the default for characters in none of them. */
+enum {
+  widechar_table_ascii,
+  widechar_table_private,
+  widechar_table_nonprint,
+  widechar_table_nonchar,
+  widechar_table_combining,
+  widechar_table_combiningletters,
+  widechar_table_doublewide,
+  widechar_table_ambiguous,
+  widechar_table_unassigned,
+  widechar_table_widened,
+  widechar_table_default,
+  widechar_table_count
+};
+
+#define widechar_LATENCY_BUCKETS 32
+
+struct widechar_stats {
+  uint64_t lookups;
+  uint64_t hits[widechar_table_count];   // Lookups resolved by each table.
+  uint64_t probes[widechar_table_count]; // Lookups by the number of tables probed.
+  // Lookups by duration: bucket i counts those under 2^i ns and at least 2^(i-1) ns.
+  uint64_t latency_ns[widechar_LATENCY_BUCKETS];
+};
+
+#ifdef WIDECHAR_WIDTH_STATS
+static struct widechar_stats widechar_stats_counters;
+
+/* The number of tables wcwidth probes to resolve a lookup from each table. */
+static const unsigned char widechar_table_probes[widechar_table_count] = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10};
+
+#define widechar_STATS_HIT(table)                                                              \
+  (widechar_stats_counters.lookups++, widechar_stats_counters.hits[table]++,                         \
+   widechar_stats_counters.probes[widechar_table_probes[table]]++)
+
+/* Copy the counters into *out. */
+void widechar_stats_snapshot(struct widechar_stats *out) {
+    *out = widechar_stats_counters;
+}
+
+/* Set the counters to zero. */
+void widechar_stats_reset(void) {
+    struct widechar_stats zero = {0};
+    widechar_stats_counters = zero;
+}
+#else
+#define widechar_STATS_HIT(table) ((void)0)
+#endif
+
+#ifdef WIDECHAR_WIDTH_STATS_LATENCY
+#include <time.h>
+
+static int widechar_wcwidth_untimed(uint32_t c);
+
+/* Return the width of character c, or a special negative value, and record the time it took. */
+int widechar_wcwidth(uint32_t c) {
+    struct timespec start, end;
+    uint64_t ns;
+    int bucket = 0;
+    int result;
+    timespec_get(&start, TIME_UTC);
+    result = widechar_wcwidth_untimed(c);
+    timespec_get(&end, TIME_UTC);
+    ns = (uint64_t)(end.tv_sec - start.tv_sec) * 1000000000u + end.tv_nsec - start.tv_nsec;
+    while (bucket < widechar_LATENCY_BUCKETS - 1 && (ns >> bucket) != 0)
+        bucket++;
+    widechar_stats_counters.latency_ns[bucket]++;
+    return result;
+}
+
+/* The definition below is the untimed lookup. */
+#define widechar_wcwidth widechar_wcwidth_untimed
+#endif
+
 /* Return the width of character c, or a special negative value. */
 int widechar_wcwidth(uint32_t c) {
-    if (widechar_in_table(widechar_ascii_table, widechar_ARRAY_SIZE(widechar_ascii_table), c))
+    if (widechar_in_table(widechar_ascii_table, widechar_ARRAY_SIZE(widechar_ascii_table), c)) {
+        widechar_STATS_HIT(widechar_table_ascii);
         return 1;
-    if (widechar_in_table(widechar_private_table, widechar_ARRAY_SIZE(widechar_private_table), c))
+    }
+    if (widechar_in_table(widechar_private_table, widechar_ARRAY_SIZE(widechar_private_table), c)) {
+        widechar_STATS_HIT(widechar_table_private);
         return widechar_private_use;
-    if (widechar_in_table(widechar_nonprint_table, widechar_ARRAY_SIZE(widechar_nonprint_table), c))
+    }
+    if (widechar_in_table(widechar_nonprint_table, widechar_ARRAY_SIZE(widechar_nonprint_table), c)) {
+        widechar_STATS_HIT(widechar_table_nonprint);
         return widechar_nonprint;
-    if (widechar_in_table(widechar_nonchar_table, widechar_ARRAY_SIZE(widechar_nonchar_table), c))
+    }
+    if (widechar_in_table(widechar_nonchar_table, widechar_ARRAY_SIZE(widechar_nonchar_table), c)) {
+        widechar_STATS_HIT(widechar_table_nonchar);
         return widechar_non_character;
-    if (widechar_in_table(widechar_combining_table, widechar_ARRAY_SIZE(widechar_combining_table), c))
+    }
+    if (widechar_in_table(widechar_combining_table, widechar_ARRAY_SIZE(widechar_combining_table), c)) {
+        widechar_STATS_HIT(widechar_table_combining);
         return widechar_combining;
-    if (widechar_in_table(widechar_combiningletters_table, widechar_ARRAY_SIZE(widechar_combiningletters_table), c))
+    }
+    if (widechar_in_table(widechar_combiningletters_table, widechar_ARRAY_SIZE(widechar_combiningletters_table), c)) {
+        widechar_STATS_HIT(widechar_table_combiningletters);
         return widechar_combining;
-    if (widechar_in_table(widechar_doublewide_table, widechar_ARRAY_SIZE(widechar_doublewide_table), c))
+    }
+    if (widechar_in_table(widechar_doublewide_table, widechar_ARRAY_SIZE(widechar_doublewide_table), c)) {
+        widechar_STATS_HIT(widechar_table_doublewide);
         return 2;
-    if (widechar_in_table(widechar_ambiguous_table, widechar_ARRAY_SIZE(widechar_ambiguous_table), c))
+    }
+    if (widechar_in_table(widechar_ambiguous_table, widechar_ARRAY_SIZE(widechar_ambiguous_table), c)) {
+        widechar_STATS_HIT(widechar_table_ambiguous);
         return widechar_ambiguous;
-    if (widechar_in_table(widechar_unassigned_table, widechar_ARRAY_SIZE(widechar_unassigned_table), c))
+    }
+    if (widechar_in_table(widechar_unassigned_table, widechar_ARRAY_SIZE(widechar_unassigned_table), c)) {
+        widechar_STATS_HIT(widechar_table_unassigned);
         return widechar_unassigned;
-    if (widechar_in_table(widechar_widened_table, widechar_ARRAY_SIZE(widechar_widened_table), c))
+    }
+    if (widechar_in_table(widechar_widened_table, widechar_ARRAY_SIZE(widechar_widened_table), c)) {
+        widechar_STATS_HIT(widechar_table_widened);
         return widechar_widened_in_9;
+    }
+    widechar_STATS_HIT(widechar_table_default);
     return 1;
 }
 
+#ifdef WIDECHAR_WIDTH_STATS_LATENCY
+#undef widechar_wcwidth
+#endif
+
 #endif // WIDECHAR_WIDTH_H
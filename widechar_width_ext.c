@@ -0,0 +1,205 @@
+/**
+ * widechar_width_ext.c for Unicode 17.0.0
+ * See https://github.com/ridiculousfish/widecharwidth/
+ *
+ * SHA1 file hashes:
+ *  (
+ *  the hashes for generate.py and the template are git object hashes,
+ *  use `git log --all --find-object=<hash>` in the widecharwidth repository
+ *  to see which commit they correspond to,
+ *  or run `git hash-object` on the file to compare.
+ *  The other hashes are simple `sha1sum` style hashes.
+ *  )
+ *
+ *  generate.py:         4fd007b14cfdafa9061039befcf51ce643ad14bf
+ *  template_ext.c:      32a3cf88186e643ed83f5f810ebd907fb957c2b5
+ *  UnicodeData.txt:     50dffef1b7d1f97b72e4c2adceb9b2245f0f34ba
+ *  EastAsianWidth.txt:  2cadc5034b6206ad84b75898a1d4186bb38fc12b
+ *  emoji-data.txt:      3d123e12f70f63e609c4281ce83dfdd9ac7443d2
+ *
+ * An optional CPython extension module, _widechar_width, built from
+ * widechar_width_c.h. widechar_width.py uses it in place of its pure Python
+ * lookups when it is importable. Build it with `make python-ext`.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include "widechar_width_c.h"
+
+/* The number of special values, which are -1 down to -widechar_SPECIAL_COUNT. */
+#define widechar_SPECIAL_COUNT 7
+
+/* The members of widechar_width.Special, indexed by -value - 1. */
+static PyObject *widechar_specials[widechar_SPECIAL_COUNT];
+
+/* Convert a str of one character or an int to a codepoint.
+   Return -1 with an exception set on failure. */
+static long widechar_to_codepoint(PyObject *arg) {
+    long c;
+    if (PyUnicode_Check(arg)) {
+        if (PyUnicode_GET_LENGTH(arg) != 1) {
+            PyErr_SetString(PyExc_ValueError, "Argument must be a codepoint as a string or int");
+            return -1;
+        }
+        return (long)PyUnicode_READ_CHAR(arg, 0);
+    }
+    c = PyLong_AsLong(arg);
+    if (c == -1 && PyErr_Occurred()) {
+        if (PyErr_ExceptionMatches(PyExc_OverflowError)) {
+            PyErr_SetString(PyExc_ValueError, "Argument is out of Unicode range");
+        }
+        return -1;
+    }
+    if (c < 0 || c > 0x10FFFF) {
+        PyErr_SetString(PyExc_ValueError, "Argument is out of Unicode range");
+        return -1;
+    }
+    return c;
+}
+
+/* Read a policy: a sequence of the widths for the special values -1 down to -7. */
+static int widechar_read_policy(PyObject *policy, int widths[widechar_SPECIAL_COUNT]) {
+    Py_ssize_t i;
+    PyObject *seq = PySequence_Fast(policy, "policy must be a sequence");
+    if (!seq) {
+        return -1;
+    }
+    if (PySequence_Fast_GET_SIZE(seq) != widechar_SPECIAL_COUNT) {
+        PyErr_SetString(PyExc_ValueError, "policy must have a width for each special value");
+        Py_DECREF(seq);
+        return -1;
+    }
+    for (i = 0; i < widechar_SPECIAL_COUNT; i++) {
+        widths[i] = (int)PyLong_AsLong(PySequence_Fast_GET_ITEM(seq, i));
+        if (widths[i] == -1 && PyErr_Occurred()) {
+            Py_DECREF(seq);
+            return -1;
+        }
+    }
+    Py_DECREF(seq);
+    return 0;
+}
+
+static PyObject *widechar_py_set_specials(PyObject *self, PyObject *arg) {
+    Py_ssize_t i;
+    PyObject *seq = PySequence_Fast(arg, "specials must be a sequence");
+    if (!seq) {
+        return NULL;
+    }
+    if (PySequence_Fast_GET_SIZE(seq) != widechar_SPECIAL_COUNT) {
+        PyErr_SetString(PyExc_ValueError, "specials must have an entry for each special value");
+        Py_DECREF(seq);
+        return NULL;
+    }
+    for (i = 0; i < widechar_SPECIAL_COUNT; i++) {
+        PyObject *special = PySequence_Fast_GET_ITEM(seq, i);
+        Py_INCREF(special);
+        Py_XSETREF(widechar_specials[i], special);
+    }
+    Py_DECREF(seq);
+    Py_RETURN_NONE;
+}
+
+static PyObject *widechar_py_wcwidth(PyObject *self, PyObject *arg) {
+    int width;
+    long c = widechar_to_codepoint(arg);
+    if (c < 0) {
+        return NULL;
+    }
+    width = widechar_wcwidth((uint32_t)c);
+    if (width < 0 && widechar_specials[-width - 1]) {
+        Py_INCREF(widechar_specials[-width - 1]);
+        return widechar_specials[-width - 1];
+    }
+    return PyLong_FromLong(width);
+}
+
+static PyObject *widechar_py_wcswidth(PyObject *self, PyObject *args) {
+    PyObject *str, *policy;
+    int widths[widechar_SPECIAL_COUNT];
+    Py_ssize_t i, len;
+    long total = 0;
+    int kind;
+    const void *data;
+
+    if (!PyArg_ParseTuple(args, "UO:wcswidth", &str, &policy)) {
+        return NULL;
+    }
+    if (widechar_read_policy(policy, widths) < 0) {
+        return NULL;
+    }
+    len = PyUnicode_GET_LENGTH(str);
+    kind = PyUnicode_KIND(str);
+    data = PyUnicode_DATA(str);
+    for (i = 0; i < len; i++) {
+        Py_UCS4 c = PyUnicode_READ(kind, data, i);
+        int width = (c >= 0x20 && c < 0x7F) ? 1 : widechar_wcwidth(c);
+        total += width < 0 ? widths[-width - 1] : width;
+    }
+    return PyLong_FromLong(total);
+}
+
+static PyObject *widechar_py_classify(PyObject *self, PyObject *args) {
+    Py_buffer src, dst;
+    const uint32_t *codepoints;
+    int8_t *out;
+    Py_ssize_t i, count;
+
+    if (!PyArg_ParseTuple(args, "y*w*:classify", &src, &dst)) {
+        return NULL;
+    }
+    if (src.itemsize != 4 || dst.itemsize != 1 || src.len / 4 != dst.len) {
+        PyErr_SetString(PyExc_ValueError,
+                        "classify needs a buffer of 32 bit codepoints and a buffer of as many bytes");
+        PyBuffer_Release(&src);
+        PyBuffer_Release(&dst);
+        return NULL;
+    }
+    codepoints = (const uint32_t *)src.buf;
+    out = (int8_t *)dst.buf;
+    count = dst.len;
+    for (i = 0; i < count; i++) {
+        if (codepoints[i] > 0x10FFFF) {
+            PyErr_SetString(PyExc_ValueError, "Argument is out of Unicode range");
+            PyBuffer_Release(&src);
+            PyBuffer_Release(&dst);
+            return NULL;
+        }
+        out[i] = (int8_t)widechar_wcwidth(codepoints[i]);
+    }
+    PyBuffer_Release(&src);
+    PyBuffer_Release(&dst);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef widechar_methods[] = {
+    {"set_specials", widechar_py_set_specials, METH_O,
+     "Set the objects wcwidth returns for the special values -1 down to -7."},
+    {"wcwidth", widechar_py_wcwidth, METH_O,
+     "Return the width of a codepoint given as a str or int, or a special value."},
+    {"wcswidth", widechar_py_wcswidth, METH_VARARGS,
+     "Return the width of a str, given the widths for the special values -1 down to -7."},
+    {"classify", widechar_py_classify, METH_VARARGS,
+     "Write the wcwidth of each 32 bit codepoint in a buffer to a buffer of int8."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef widechar_module = {
+    PyModuleDef_HEAD_INIT, "_widechar_width", NULL, -1, widechar_methods,
+};
+
+PyMODINIT_FUNC PyInit__widechar_width(void) {
+    PyObject *module = PyModule_Create(&widechar_module);
+    if (!module) {
+        return NULL;
+    }
+    /* widechar_width.py only uses this module if it was generated alongside it,
+       from the same data. */
+    if (PyModule_AddStringConstant(module, "GENERATED_BY",
+                                   "17.0.0 4fd007b14cfdafa9061039befcf51ce643ad14bf d6af739cfea29fc90d3303de51f3e3b96ac91675") < 0) {
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}